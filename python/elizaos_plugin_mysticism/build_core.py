@@ -0,0 +1,45 @@
+"""Compile the optional Cython core of the astrology engine in place.
+
+Usage: ``python -m elizaos_plugin_mysticism.build_core``
+
+Needs the ``compiled`` extra (``pip install -e ".[compiled]"``: Cython 3 and
+setuptools) and a C compiler. The extension is written next to
+``engines/_astrology_core.pyx``, where ``astrology.py`` picks it up; delete it
+to go back to the pure-Python solver and lunar series.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from Cython.Build import cythonize
+from setuptools import Distribution, Extension  # type: ignore[import-untyped]
+
+_SOURCE_ROOT = Path(__file__).resolve().parent.parent
+_MODULE = "elizaos_plugin_mysticism.engines._astrology_core"
+
+
+def main() -> None:
+    source = _SOURCE_ROOT / (_MODULE.replace(".", "/") + ".pyx")
+    extension = Extension(_MODULE, [str(source)])
+    # Explicit (empty) packages so setuptools doesn't try to discover the
+    # flat layout, and an absolute package_dir so --inplace targets the source
+    dist = Distribution(
+        {
+            "name": "elizaos-plugin-mysticism-core",
+            "ext_modules": cythonize([extension], language_level=3),
+            "packages": [],
+            "package_dir": {"": str(_SOURCE_ROOT)},
+        }
+    )
+    with tempfile.TemporaryDirectory() as build_base:
+        # Intermediate objects go to a scratch dir, not ./build
+        dist.get_command_obj("build").build_base = build_base
+        dist.get_command_obj("build_ext").inplace = True
+        dist.run_command("build_ext")
+    print(dist.get_command_obj("build_ext").get_ext_fullpath(_MODULE))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+"""Write pre-decoded snapshots of the engine data files.
+
+Usage: ``python -m elizaos_plugin_mysticism.build_data_cache``
+
+Re-run after editing the JSON data; a snapshot older than its JSON file is
+ignored (and the JSON parsed instead) until then.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from elizaos_plugin_mysticism.engines._datacache import write_snapshot
+
+_DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
+
+
+def main() -> None:
+    for json_path in sorted(_DATA_DIR.glob("*/*.json")):
+        print(write_snapshot(json_path))
+
+
+if __name__ == "__main__":
+    main()
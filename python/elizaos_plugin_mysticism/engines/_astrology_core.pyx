@@ -0,0 +1,77 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Optional compiled Kepler solver and lunar series for the astrology engine.
+
+Build in place (needs Cython 3 and setuptools, the ``compiled`` extra, and a
+C compiler) with::
+
+    python -m elizaos_plugin_mysticism.build_core
+
+``astrology.py`` uses this module when it is importable and falls back to the
+pure-Python ``_kepler_sincos`` and ``_moon_series`` otherwise; both produce
+the same results.
+"""
+
+from libc.math cimport cos, fabs, sin
+
+
+cdef inline void _solve_kepler(
+    double M, double e, double* E_out, double* sin_out, double* cos_out
+) noexcept nogil:
+    cdef double sin_M = sin(M)
+    cdef double E = M + e * sin_M * (1 + e * cos(M) + e * e * (1 - 1.5 * sin_M * sin_M))
+    cdef double sin_E, cos_E, dE
+    cdef int i
+    for i in range(50):
+        sin_E = sin(E)
+        cos_E = cos(E)
+        dE = (E - e * sin_E - M) / (1 - e * cos_E)
+        E -= dE
+        if fabs(dE) < 1e-8:
+            E_out[0] = E
+            sin_out[0] = sin_E - cos_E * dE
+            cos_out[0] = cos_E + sin_E * dE
+            return
+    E_out[0] = E
+    sin_out[0] = sin(E)
+    cos_out[0] = cos(E)
+
+
+def kepler_sincos(double M, double e):
+    """Newton solution of Kepler's equation as ``(E, sin(E), cos(E))``."""
+    cdef double E, sin_E, cos_E
+    _solve_kepler(M, e, &E, &sin_E, &cos_E)
+    return E, sin_E, cos_E
+
+
+def moon_series(double D_rad, double M_rad, double Mp_rad, double F_rad):
+    """Periodic terms of the Moon's longitude, in 1e-6 degrees."""
+    cdef double D2 = 2 * D_rad
+    cdef double D4 = 4 * D_rad
+    cdef double Mp2 = 2 * Mp_rad
+    cdef double F2 = 2 * F_rad
+    return (
+        6288774 * sin(Mp_rad)
+        + 1274027 * sin(D2 - Mp_rad)
+        + 658314 * sin(D2)
+        + 213618 * sin(Mp2)
+        - 185116 * sin(M_rad)
+        - 114332 * sin(F2)
+        + 58793 * sin(D2 - Mp2)
+        + 57066 * sin(D2 - M_rad - Mp_rad)
+        + 53322 * sin(D2 + Mp_rad)
+        + 45758 * sin(D2 - M_rad)
+        - 40923 * sin(M_rad - Mp_rad)
+        - 34720 * sin(D_rad)
+        - 30383 * sin(M_rad + Mp_rad)
+        + 15327 * sin(D2 - F2)
+        - 12528 * sin(Mp_rad + F2)
+        + 10980 * sin(Mp_rad - F2)
+        + 10675 * sin(D4 - Mp_rad)
+        + 10034 * sin(3 * Mp_rad)
+        + 8548 * sin(D4 - Mp2)
+        - 7888 * sin(D2 + M_rad - Mp_rad)
+        - 6766 * sin(D2 + M_rad)
+        - 5163 * sin(D_rad - Mp_rad)
+        + 4987 * sin(D_rad + M_rad)
+        + 4036 * sin(D2 - M_rad + Mp_rad)
+    )
@@ -0,0 +1,58 @@
+"""JSON data loading with optional pre-decoded snapshots.
+
+Running ``python -m elizaos_plugin_mysticism.build_data_cache`` stores the
+decoded contents of each data file next to it in ``marshal`` format, which
+loads several times faster than parsing the JSON. :func:`load_json` uses a
+snapshot when it is newer than its JSON file and was written by the same
+Python version, and parses the JSON otherwise.
+"""
+
+from __future__ import annotations
+
+import marshal
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    import json
+
+    _json_loads = json.loads
+
+_SNAPSHOT_TAG = tuple(sys.version_info[:2])
+
+
+def snapshot_path(json_path: Path) -> Path:
+    return json_path.with_suffix(".marshal")
+
+
+def load_json(json_path: Path) -> Any:
+    """Decoded contents of *json_path*, from its snapshot when usable."""
+    data = _load_snapshot(json_path)
+    if data is None:
+        data = _json_loads(json_path.read_bytes())
+    return data
+
+
+def _load_snapshot(json_path: Path) -> Optional[Any]:
+    path = snapshot_path(json_path)
+    try:
+        if path.stat().st_mtime < json_path.stat().st_mtime:
+            return None
+        tag, data = marshal.loads(path.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    return data if tag == _SNAPSHOT_TAG else None
+
+
+def write_snapshot(json_path: Path) -> Path:
+    """Decode *json_path* and store the result as a snapshot next to it."""
+    path = snapshot_path(json_path)
+    data = _json_loads(json_path.read_bytes())
+    path.write_bytes(marshal.dumps((_SNAPSHOT_TAG, data)))
+    return path
@@ -10,13 +10,16 @@ No external dependencies (no Swiss Ephemeris).
 
 from __future__ import annotations
 
-import json
 import math
 import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Literal, Optional
 
+from elizaos_plugin_mysticism.engines._datacache import load_json
 from elizaos_plugin_mysticism.types import (
     AstrologyReadingState,
     BirthData,
@@ -45,18 +48,19 @@ SIGN_ORDER: list[str] = [
 ]
 
 
+def _sign_triple(total_degrees: float) -> tuple[str, float, float]:
+    """``(sign, degrees within sign, normalised degrees)`` for a longitude."""
+    # Python's % already returns [0, 360) for negative longitudes, and the
+    # product with 1/30 truncates to the same index as deg // 30 on [0, 360)
+    deg = total_degrees % 360
+    sign_index = int(deg * (1 / 30))
+    return SIGN_ORDER[sign_index], deg - sign_index * 30, deg
+
+
 def degrees_to_sign(total_degrees: float) -> SignPosition:
     """Convert ecliptic longitude to sign + degrees within sign."""
-    deg = total_degrees % 360
-    if deg < 0:
-        deg += 360
-    sign_index = int(deg // 30)
-    within_sign = deg - sign_index * 30
-    return SignPosition(
-        sign=SIGN_ORDER[sign_index],
-        degrees=within_sign,
-        totalDegrees=deg,
-    )
+    sign, within_sign, deg = _sign_triple(total_degrees)
+    return SignPosition(sign=sign, degrees=within_sign, totalDegrees=deg)
 
 
 # ---------------------------------------------------------------------------
@@ -66,23 +70,102 @@ def degrees_to_sign(total_degrees: float) -> SignPosition:
 _DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data"
 _aspect_defs_cache: Optional[list[dict]] = None
 
+# Parallel per-field views of the aspect definitions, filled by
+# _load_aspect_definitions() so the aspect loop never touches the dicts.
+_DEF_DEG: tuple[float, ...] = ()
+_DEF_ORB: tuple[float, ...] = ()
+_DEF_NAME: tuple[str, ...] = ()
+_DEF_SYMBOL: tuple[str, ...] = ()
+_DEF_NATURE: tuple[Literal["harmonious", "challenging", "neutral"], ...] = ()
+# Candidate definition indices per whole degree of separation (0..180), so a
+# pair is only tested against the aspects whose orb window can contain it.
+_DEF_BUCKETS: tuple[tuple[int, ...], ...] = ()
+
 
 def _load_aspect_definitions() -> list[dict]:
     global _aspect_defs_cache
+    global _DEF_DEG, _DEF_ORB, _DEF_NAME, _DEF_SYMBOL, _DEF_NATURE, _DEF_BUCKETS
     if _aspect_defs_cache is not None:
         return _aspect_defs_cache
     path = _DATA_DIR / "astrology" / "aspects.json"
-    with open(path, "r", encoding="utf-8") as f:
-        _aspect_defs_cache = json.load(f)
+    data = load_json(path)
+    _DEF_DEG = tuple(d["degrees"] for d in data)
+    _DEF_ORB = tuple(d["orb"] for d in data)
+    _DEF_NAME = tuple(d["name"] for d in data)
+    _DEF_SYMBOL = tuple(d["symbol"] for d in data)
+    _DEF_NATURE = tuple(d["nature"] for d in data)
+    _DEF_BUCKETS = tuple(
+        tuple(
+            k
+            for k, (exact, orb) in enumerate(zip(_DEF_DEG, _DEF_ORB))
+            if exact - orb < b + 1 and exact + orb >= b
+        )
+        for b in range(181)
+    )
+    _aspect_defs_cache = data
     return _aspect_defs_cache
 
 
+def _ensure_aspects_loaded() -> None:
+    """Load the aspect definitions now so the first chart doesn't pay the I/O."""
+    _load_aspect_definitions()
+
+
+_ensure_aspects_loaded()
+
+
 # ---------------------------------------------------------------------------
 # Orbital elements at J2000.0 (Standish 1992 / Meeus)
 # ---------------------------------------------------------------------------
 
-@dataclass
+# Planets with geocentric positions, in the fixed order used by the batched
+# longitude helpers below.
+_GEO_PLANETS: tuple[str, ...] = (
+    "mercury", "venus", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto",
+)
+
+# Row order of _ORBITAL: Earth first, then _GEO_PLANETS.
+_ELEM_ORDER: tuple[str, ...] = ("earth", *_GEO_PLANETS)
+
+# One row per body; columns follow the OrbitalElements field order:
+#   L0, L1, a, e0, e1, I0, I1, W0, W1, w0, w1
+_ORBITAL: tuple[tuple[float, ...], ...] = (
+    # earth
+    (100.46457166, 35999.37244981, 1.00000261, 0.01671123, -0.00004392,
+     0.00001531, -0.01294668, 0.0, 0.0, 102.93768193, 0.32327364),
+    # mercury
+    (252.25032350, 149472.67411175, 0.38709927, 0.20563593, 0.00001906,
+     7.00497902, -0.00594749, 48.33076593, -0.12534081, 77.45779628, 0.16047689),
+    # venus
+    (181.97909950, 58517.81538729, 0.72333566, 0.00677672, -0.00004107,
+     3.39467605, -0.00078890, 76.67984255, -0.27769418, 131.60246718, 0.00268329),
+    # mars
+    (355.44656299, 19140.30268499, 1.52371034, 0.09339410, 0.00007882,
+     1.84969142, -0.00813131, 49.55953891, -0.29257343, 336.05637041, 0.44441088),
+    # jupiter
+    (34.39644051, 3034.74612775, 5.20288700, 0.04838624, -0.00013253,
+     1.30439695, -0.00183714, 100.47390909, 0.20469106, 14.72847983, 0.21252668),
+    # saturn
+    (49.95424423, 1222.49362201, 9.53667594, 0.05386179, -0.00050991,
+     2.48599187, 0.00193609, 113.66242448, -0.28867794, 92.59887831, -0.41897216),
+    # uranus
+    (313.23810451, 428.48202785, 19.18916464, 0.04725744, -0.00004397,
+     0.77263783, -0.00242939, 74.01692503, 0.04240589, 170.95427630, 0.40805281),
+    # neptune
+    (304.87997031, 218.45945325, 30.06992276, 0.00859048, 0.00005105,
+     1.77004347, 0.00035372, 131.78422574, -0.01299630, 44.96476227, -0.32241464),
+    # pluto
+    (238.92903833, 145.20780515, 39.48211675, 0.24882730, 0.00005170,
+     17.14001206, 0.00004818, 110.30393684, -0.01183482, 224.06891629, -0.04062942),
+)
+_PLANET_INDEX: dict[str, int] = {p: i for i, p in enumerate(_ELEM_ORDER)}
+_EARTH = _PLANET_INDEX["earth"]
+
+
+@dataclass(frozen=True)
 class OrbitalElements:
+    """Read-only view of one _ORBITAL row."""
+
     L0: float  # Mean longitude at J2000.0 (degrees)
     L1: float  # Mean longitude rate (degrees per Julian century)
     a: float   # Semi-major axis (AU)
@@ -97,77 +180,49 @@ class OrbitalElements:
 
 
 ORBITAL_ELEMENTS: dict[str, OrbitalElements] = {
-    "mercury": OrbitalElements(
-        L0=252.25032350, L1=149472.67411175,
-        a=0.38709927, e0=0.20563593, e1=0.00001906,
-        I0=7.00497902, I1=-0.00594749,
-        W0=48.33076593, W1=-0.12534081,
-        w0=77.45779628, w1=0.16047689,
-    ),
-    "venus": OrbitalElements(
-        L0=181.97909950, L1=58517.81538729,
-        a=0.72333566, e0=0.00677672, e1=-0.00004107,
-        I0=3.39467605, I1=-0.00078890,
-        W0=76.67984255, W1=-0.27769418,
-        w0=131.60246718, w1=0.00268329,
-    ),
-    "earth": OrbitalElements(
-        L0=100.46457166, L1=35999.37244981,
-        a=1.00000261, e0=0.01671123, e1=-0.00004392,
-        I0=0.00001531, I1=-0.01294668,
-        W0=0.0, W1=0.0,
-        w0=102.93768193, w1=0.32327364,
-    ),
-    "mars": OrbitalElements(
-        L0=355.44656299, L1=19140.30268499,
-        a=1.52371034, e0=0.09339410, e1=0.00007882,
-        I0=1.84969142, I1=-0.00813131,
-        W0=49.55953891, W1=-0.29257343,
-        w0=336.05637041, w1=0.44441088,
-    ),
-    "jupiter": OrbitalElements(
-        L0=34.39644051, L1=3034.74612775,
-        a=5.20288700, e0=0.04838624, e1=-0.00013253,
-        I0=1.30439695, I1=-0.00183714,
-        W0=100.47390909, W1=0.20469106,
-        w0=14.72847983, w1=0.21252668,
-    ),
-    "saturn": OrbitalElements(
-        L0=49.95424423, L1=1222.49362201,
-        a=9.53667594, e0=0.05386179, e1=-0.00050991,
-        I0=2.48599187, I1=0.00193609,
-        W0=113.66242448, W1=-0.28867794,
-        w0=92.59887831, w1=-0.41897216,
-    ),
-    "uranus": OrbitalElements(
-        L0=313.23810451, L1=428.48202785,
-        a=19.18916464, e0=0.04725744, e1=-0.00004397,
-        I0=0.77263783, I1=-0.00242939,
-        W0=74.01692503, W1=0.04240589,
-        w0=170.95427630, w1=0.40805281,
-    ),
-    "neptune": OrbitalElements(
-        L0=304.87997031, L1=218.45945325,
-        a=30.06992276, e0=0.00859048, e1=0.00005105,
-        I0=1.77004347, I1=0.00035372,
-        W0=131.78422574, W1=-0.01299630,
-        w0=44.96476227, w1=-0.32241464,
-    ),
-    "pluto": OrbitalElements(
-        L0=238.92903833, L1=145.20780515,
-        a=39.48211675, e0=0.24882730, e1=0.00005170,
-        I0=17.14001206, I1=0.00004818,
-        W0=110.30393684, W1=-0.01183482,
-        w0=224.06891629, w1=-0.04062942,
-    ),
+    p: OrbitalElements(*row) for p, row in zip(_ELEM_ORDER, _ORBITAL)
 }
 
 
+def _planet_index(planet_id: str) -> int:
+    idx = _PLANET_INDEX.get(planet_id)
+    if idx is None:
+        raise ValueError(f"No orbital elements for: {planet_id}")
+    return idx
+
+
 # ---------------------------------------------------------------------------
 # Julian Day calculation
 # ---------------------------------------------------------------------------
 
 
+def _julian_day_month_base(year: int, month: int) -> float:
+    """Julian Day of day 0 of *month*, 0h (add the day of month to it)."""
+    y = year
+    m = month
+    if m <= 2:
+        y -= 1
+        m += 12
+    A = y // 100
+    B = 2 - A + A // 4
+    # Exact integer forms of int(365.25 * (y + 4716)) and int(30.6001 * (m + 1))
+    return (1461 * (y + 4716)) // 4 + (153 * (m + 1)) // 5 + B - 1524.5
+
+
+# Month bases for the years charts are normally cast for, indexed by
+# (year - _JD_TABLE_FIRST_YEAR) * 12 + month - 1
+_JD_TABLE_FIRST_YEAR = 1700
+_JD_TABLE_LAST_YEAR = 2100
+_JD_MONTH_BASES = array(
+    "d",
+    [
+        _julian_day_month_base(year, month)
+        for year in range(_JD_TABLE_FIRST_YEAR, _JD_TABLE_LAST_YEAR + 1)
+        for month in range(1, 13)
+    ],
+)
+
+
 def to_julian_day(
     year: int,
     month: int,
@@ -179,22 +234,12 @@ def to_julian_day(
 
     Handles both Julian and Gregorian calendars.
     """
-    y = year
-    m = month
-    if m <= 2:
-        y -= 1
-        m += 12
-    A = y // 100
-    B = 2 - A + A // 4
-    day_fraction = (hour + minute / 60) / 24
-    return (
-        int(365.25 * (y + 4716))
-        + int(30.6001 * (m + 1))
-        + day
-        + day_fraction
-        + B
-        - 1524.5
-    )
+    day_fraction = (hour * 60 + minute) / 1440
+    if _JD_TABLE_FIRST_YEAR <= year <= _JD_TABLE_LAST_YEAR and 1 <= month <= 12:
+        base = _JD_MONTH_BASES[(year - _JD_TABLE_FIRST_YEAR) * 12 + month - 1]
+    else:
+        base = _julian_day_month_base(year, month)
+    return base + day + day_fraction
 
 
 def julian_centuries(jd: float) -> float:
@@ -208,8 +253,12 @@ def julian_centuries(jd: float) -> float:
 
 
 def _norm_deg(deg: float) -> float:
-    """Normalise angle to [0, 360)."""
-    return deg % 360 if deg >= 0 else (deg % 360 + 360) % 360
+    """Normalise angle to [0, 360).
+
+    Python's ``%`` already returns a non-negative result for a positive
+    divisor, so no sign branch is needed.  The longitude kernels inline this.
+    """
+    return deg % 360.0
 
 
 # ---------------------------------------------------------------------------
@@ -222,13 +271,41 @@ def solve_kepler(M: float, e: float) -> float:
 
     M and E in radians.
     """
-    E = M  # initial guess
+    return _kepler_sincos(M, e)[0]
+
+
+def _kepler_sincos(M: float, e: float) -> tuple[float, float, float]:
+    """Newton solution of Kepler's equation as ``(E, sin(E), cos(E))``.
+
+    Newton starts from the third-order series in e,
+    ``M + e sin M + (e**2/2) sin 2M + (e**3/8)(3 sin 3M - sin M)``, and
+    stops once a step is below 1e-8: convergence is quadratic, so the error
+    left after such a step is of order dE**2 and below double precision.
+    Each iteration evaluates sin/cos once; on convergence those values are
+    carried through the final step to first order (the dropped term is also
+    O(dE**2)), so callers never recompute them.
+    """
+    sin_M = math.sin(M)
+    E = M + e * sin_M * (1 + e * math.cos(M) + e * e * (1 - 1.5 * sin_M * sin_M))
     for _ in range(50):
-        dE = (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+        sin_E = math.sin(E)
+        cos_E = math.cos(E)
+        dE = (E - e * sin_E - M) / (1 - e * cos_E)
         E -= dE
-        if abs(dE) < 1e-12:
-            break
-    return E
+        if abs(dE) < 1e-8:
+            return E, sin_E - cos_E * dE, cos_E + sin_E * dE
+    return E, math.sin(E), math.cos(E)
+
+
+# The pure-Python solver, kept for comparison with the compiled one
+_kepler_sincos_python = _kepler_sincos
+
+try:  # optional Cython build of the solver above, see _astrology_core.pyx
+    import elizaos_plugin_mysticism.engines._astrology_core as _core  # type: ignore[import-not-found]
+except ImportError:
+    pass
+else:
+    _kepler_sincos = _core.kepler_sincos
 
 
 # ---------------------------------------------------------------------------
@@ -236,104 +313,119 @@ def solve_kepler(M: float, e: float) -> float:
 # ---------------------------------------------------------------------------
 
 
-def heliocentric_longitude(planet_id: str, jd: float) -> float:
-    """Compute heliocentric ecliptic longitude for a planet at a given JD."""
-    el = ORBITAL_ELEMENTS.get(planet_id)
-    if el is None:
-        raise ValueError(f"No orbital elements for: {planet_id}")
-
+def _heliocentric_longitude(idx: int, jd: float) -> float:
+    """Heliocentric ecliptic longitude for the planet at ``_ELEM_ORDER[idx]``."""
+    L0, L1, _a, e0, e1, I0, I1, W0, W1, w0, w1 = _ORBITAL[idx]
     T = julian_centuries(jd)
 
     # Current elements
-    L = _norm_deg(el.L0 + el.L1 * T)
-    e = el.e0 + el.e1 * T
-    w = _norm_deg(el.w0 + el.w1 * T)
-    W = _norm_deg(el.W0 + el.W1 * T)
-    I = el.I0 + el.I1 * T
+    L = (L0 + L1 * T) % 360.0
+    e = e0 + e1 * T
+    w = (w0 + w1 * T) % 360.0
+    W = (W0 + W1 * T) % 360.0
+    I = I0 + I1 * T
 
     # Mean anomaly
-    M = _norm_deg(L - w)
+    M = (L - w) % 360.0
     M_rad = M * DEG2RAD
 
     # Solve Kepler's equation
-    E = solve_kepler(M_rad, e)
+    _E, sin_E, cos_E = _kepler_sincos(M_rad, e)
 
     # True anomaly
-    sin_v = (math.sqrt(1 - e * e) * math.sin(E)) / (1 - e * math.cos(E))
-    cos_v = (math.cos(E) - e) / (1 - e * math.cos(E))
+    denom = 1 - e * cos_E
+    sin_v = (math.sqrt(1 - e * e) * sin_E) / denom
+    cos_v = (cos_E - e) / denom
     v = math.atan2(sin_v, cos_v) * RAD2DEG
 
     # Heliocentric longitude in the orbital plane
-    l_helio = _norm_deg(v + w - W)
+    l_helio = (v + w - W) % 360.0
 
     # Convert from orbital plane to ecliptic
     I_rad = I * DEG2RAD
     l_helio_rad = l_helio * DEG2RAD
 
-    ecl_lon = _norm_deg(
+    ecl_lon = (
         math.atan2(
             math.sin(l_helio_rad) * math.cos(I_rad),
             math.cos(l_helio_rad),
         ) * RAD2DEG + W
-    )
+    ) % 360.0
 
     return ecl_lon
 
 
+def heliocentric_longitude(planet_id: str, jd: float) -> float:
+    """Compute heliocentric ecliptic longitude for a planet at a given JD."""
+    return _heliocentric_longitude(_planet_index(planet_id), jd)
+
+
 # ---------------------------------------------------------------------------
 # Geocentric ecliptic longitude
 # ---------------------------------------------------------------------------
 
 
+def _orbital_position(idx: int, T: float) -> tuple[float, float]:
+    """In-plane heliocentric longitude (radians) and radius (AU) of a planet.
+
+    Inclination is ignored, matching the simple 2D projection used for
+    geocentric longitudes.
+    """
+    L0, L1, a, e0, e1, _I0, _I1, _W0, _W1, w0, w1 = _ORBITAL[idx]
+    e = e0 + e1 * T
+    w = (w0 + w1 * T) % 360.0
+    M = (L0 + L1 * T - w) % 360.0 * DEG2RAD
+    _E, sin_E, cos_E = _kepler_sincos(M, e)
+    V = math.atan2(math.sqrt(1 - e * e) * sin_E, cos_E - e) * RAD2DEG
+    return (V + w) % 360.0 * DEG2RAD, a * (1 - e * cos_E)
+
+
+def _geocentric_from(
+    p_lon: float, p_R: float, earth_lon: float, earth_R: float
+) -> float:
+    """Project a heliocentric position onto the sky as seen from Earth."""
+    x = p_R * math.cos(p_lon) - earth_R * math.cos(earth_lon)
+    y = p_R * math.sin(p_lon) - earth_R * math.sin(earth_lon)
+    return (math.atan2(y, x) * RAD2DEG) % 360.0
+
+
+@lru_cache(maxsize=4096)
+def _earth_helio(jd: float) -> tuple[float, float]:
+    """Earth's heliocentric longitude (radians) and radius (AU), keyed by JD."""
+    return _orbital_position(_EARTH, julian_centuries(jd))
+
+
+@lru_cache(maxsize=16384)
+def _geocentric_longitude_cached(planet_id: str, jd: float) -> float:
+    idx = _planet_index(planet_id)
+    earth_lon, earth_R = _earth_helio(jd)
+    p_lon, p_R = _orbital_position(idx, julian_centuries(jd))
+    return _geocentric_from(p_lon, p_R, earth_lon, earth_R)
+
+
 def geocentric_longitude(planet_id: str, jd: float) -> float:
-    """Convert heliocentric position to geocentric (as seen from Earth)."""
+    """Convert heliocentric position to geocentric (as seen from Earth).
+
+    Results are cached per (planet, JD).
+    """
     if planet_id == "earth":
         raise ValueError("Cannot compute geocentric longitude of Earth")
+    return _geocentric_longitude_cached(planet_id, jd)
 
-    T = julian_centuries(jd)
 
-    # Earth's heliocentric position
-    earth_el = ORBITAL_ELEMENTS["earth"]
-    earth_L = _norm_deg(earth_el.L0 + earth_el.L1 * T)
-    earth_e = earth_el.e0 + earth_el.e1 * T
-    earth_w = _norm_deg(earth_el.w0 + earth_el.w1 * T)
-    earth_M = _norm_deg(earth_L - earth_w) * DEG2RAD
-    earth_ecc = solve_kepler(earth_M, earth_e)
-    earth_V = (
-        math.atan2(
-            math.sqrt(1 - earth_e * earth_e) * math.sin(earth_ecc),
-            math.cos(earth_ecc) - earth_e,
-        )
-        * RAD2DEG
-    )
-    earth_helio_lon = _norm_deg(earth_V + earth_w)
-    earth_R = earth_el.a * (1 - earth_e * math.cos(earth_ecc))
-
-    # Planet's heliocentric position
-    p_el = ORBITAL_ELEMENTS[planet_id]
-    p_L = _norm_deg(p_el.L0 + p_el.L1 * T)
-    p_e = p_el.e0 + p_el.e1 * T
-    p_w = _norm_deg(p_el.w0 + p_el.w1 * T)
-    p_M = _norm_deg(p_L - p_w) * DEG2RAD
-    p_ecc = solve_kepler(p_M, p_e)
-    p_V = (
-        math.atan2(
-            math.sqrt(1 - p_e * p_e) * math.sin(p_ecc),
-            math.cos(p_ecc) - p_e,
-        )
-        * RAD2DEG
-    )
-    p_helio_lon = _norm_deg(p_V + p_w)
-    p_R = p_el.a * (1 - p_e * math.cos(p_ecc))
+@lru_cache(maxsize=4096)
+def _geocentric_longitudes(jd: float) -> tuple[float, ...]:
+    """Geocentric longitudes of every planet in ``_GEO_PLANETS`` order.
 
-    # Convert to geocentric using simple 2D projection (ecliptic plane)
-    p_helio_rad = p_helio_lon * DEG2RAD
-    earth_helio_rad = earth_helio_lon * DEG2RAD
-
-    x = p_R * math.cos(p_helio_rad) - earth_R * math.cos(earth_helio_rad)
-    y = p_R * math.sin(p_helio_rad) - earth_R * math.sin(earth_helio_rad)
-
-    return _norm_deg(math.atan2(y, x) * RAD2DEG)
+    Same model and caching as :func:`geocentric_longitude`, but Earth's
+    position is shared by all planets.
+    """
+    T = julian_centuries(jd)
+    earth_lon, earth_R = _earth_helio(jd)
+    return tuple(
+        _geocentric_from(*_orbital_position(idx, T), earth_lon, earth_R)
+        for idx in range(1, len(_ELEM_ORDER))
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -341,35 +433,36 @@ def geocentric_longitude(planet_id: str, jd: float) -> float:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
 def sun_longitude(jd: float) -> float:
     """Compute the Sun's geocentric ecliptic longitude.
 
-    Uses the equation of center (Meeus).
+    Uses the equation of center (Meeus).  Results are cached per JD.
     """
     T = julian_centuries(jd)
 
     # Sun's mean longitude
-    L0 = _norm_deg(280.46646 + 36000.76983 * T + 0.0003032 * T * T)
+    L0 = ((0.0003032 * T + 36000.76983) * T + 280.46646) % 360.0
 
     # Sun's mean anomaly
-    M = _norm_deg(357.52911 + 35999.05029 * T - 0.0001537 * T * T)
+    M = ((-0.0001537 * T + 35999.05029) * T + 357.52911) % 360.0
     M_rad = M * DEG2RAD
 
     # Equation of center
     C = (
-        (1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(M_rad)
+        ((-0.000014 * T - 0.004817) * T + 1.914602) * math.sin(M_rad)
         + (0.019993 - 0.000101 * T) * math.sin(2 * M_rad)
         + 0.000289 * math.sin(3 * M_rad)
     )
 
     # Sun's true longitude
-    sun_true_lon = _norm_deg(L0 + C)
+    sun_true_lon = (L0 + C) % 360.0
 
     # Apparent longitude (nutation and aberration correction)
     omega = 125.04 - 1934.136 * T
     apparent = sun_true_lon - 0.00569 - 0.00478 * math.sin(omega * DEG2RAD)
 
-    return _norm_deg(apparent)
+    return apparent % 360.0
 
 
 # ---------------------------------------------------------------------------
@@ -377,116 +470,141 @@ def sun_longitude(jd: float) -> float:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
 def moon_longitude(jd: float) -> float:
     """Compute the Moon's geocentric ecliptic longitude.
 
-    Uses the principal terms of the lunar theory (Meeus Chapter 47).
+    Uses the principal terms of the lunar theory (Meeus Chapter 47).  Results
+    are cached per JD.
     """
     T = julian_centuries(jd)
 
+    # Mean elements in Horner form; the ``1.0 / N`` divisors are folded to
+    # constants at compile time.
+
     # Moon's mean longitude
-    Lp = _norm_deg(
-        218.3164477
-        + 481267.88123421 * T
-        - 0.0015786 * T * T
-        + T * T * T / 538841
-        - T * T * T * T / 65194000
-    )
+    Lp = (
+        (((-1.0 / 65194000 * T + 1.0 / 538841) * T - 0.0015786) * T
+         + 481267.88123421) * T
+        + 218.3164477
+    ) % 360.0
 
     # Moon's mean elongation
-    D = _norm_deg(
-        297.8501921
-        + 445267.1114034 * T
-        - 0.0018819 * T * T
-        + T * T * T / 545868
-        - T * T * T * T / 113065000
-    )
+    D = (
+        (((-1.0 / 113065000 * T + 1.0 / 545868) * T - 0.0018819) * T
+         + 445267.1114034) * T
+        + 297.8501921
+    ) % 360.0
 
     # Sun's mean anomaly
-    M = _norm_deg(
-        357.5291092
-        + 35999.0502909 * T
-        - 0.0001536 * T * T
-        + T * T * T / 24490000
-    )
+    M = (
+        ((1.0 / 24490000 * T - 0.0001536) * T + 35999.0502909) * T
+        + 357.5291092
+    ) % 360.0
 
     # Moon's mean anomaly
-    Mp = _norm_deg(
-        134.9633964
-        + 477198.8675055 * T
-        + 0.0087414 * T * T
-        + T * T * T / 69699
-        - T * T * T * T / 14712000
-    )
+    Mp = (
+        (((-1.0 / 14712000 * T + 1.0 / 69699) * T + 0.0087414) * T
+         + 477198.8675055) * T
+        + 134.9633964
+    ) % 360.0
 
     # Moon's argument of latitude
-    F = _norm_deg(
-        93.2720950
-        + 483202.0175233 * T
-        - 0.0036539 * T * T
-        - T * T * T / 3526000
-        + T * T * T * T / 863310000
-    )
+    F = (
+        (((1.0 / 863310000 * T - 1.0 / 3526000) * T - 0.0036539) * T
+         + 483202.0175233) * T
+        + 93.2720950
+    ) % 360.0
 
-    D_rad = D * DEG2RAD
-    M_rad = M * DEG2RAD
-    Mp_rad = Mp * DEG2RAD
-    F_rad = F * DEG2RAD
-
-    # Principal terms for longitude (simplified from Meeus Table 47.A)
-    sum_L = 0.0
-    sum_L += 6288774 * math.sin(Mp_rad)
-    sum_L += 1274027 * math.sin(2 * D_rad - Mp_rad)
-    sum_L += 658314 * math.sin(2 * D_rad)
-    sum_L += 213618 * math.sin(2 * Mp_rad)
-    sum_L += -185116 * math.sin(M_rad)
-    sum_L += -114332 * math.sin(2 * F_rad)
-    sum_L += 58793 * math.sin(2 * D_rad - 2 * Mp_rad)
-    sum_L += 57066 * math.sin(2 * D_rad - M_rad - Mp_rad)
-    sum_L += 53322 * math.sin(2 * D_rad + Mp_rad)
-    sum_L += 45758 * math.sin(2 * D_rad - M_rad)
-    sum_L += -40923 * math.sin(M_rad - Mp_rad)
-    sum_L += -34720 * math.sin(D_rad)
-    sum_L += -30383 * math.sin(M_rad + Mp_rad)
-    sum_L += 15327 * math.sin(2 * D_rad - 2 * F_rad)
-    sum_L += -12528 * math.sin(Mp_rad + 2 * F_rad)
-    sum_L += 10980 * math.sin(Mp_rad - 2 * F_rad)
-    sum_L += 10675 * math.sin(4 * D_rad - Mp_rad)
-    sum_L += 10034 * math.sin(3 * Mp_rad)
-    sum_L += 8548 * math.sin(4 * D_rad - 2 * Mp_rad)
-    sum_L += -7888 * math.sin(2 * D_rad + M_rad - Mp_rad)
-    sum_L += -6766 * math.sin(2 * D_rad + M_rad)
-    sum_L += -5163 * math.sin(D_rad - Mp_rad)
-    sum_L += 4987 * math.sin(D_rad + M_rad)
-    sum_L += 4036 * math.sin(2 * D_rad - M_rad + Mp_rad)
+    sum_L = _moon_series(D * DEG2RAD, M * DEG2RAD, Mp * DEG2RAD, F * DEG2RAD)
 
     # Convert from 0.000001 degrees to degrees
-    moon_lon = _norm_deg(Lp + sum_L / 1_000_000)
+    moon_lon = (Lp + sum_L / 1_000_000) % 360.0
 
     return moon_lon
 
 
+def _moon_series(D_rad: float, M_rad: float, Mp_rad: float, F_rad: float) -> float:
+    """Periodic terms of the Moon's longitude, in 1e-6 degrees.
+
+    Takes the mean elongation, Sun and Moon mean anomalies and argument of
+    latitude in radians.
+    """
+    # Principal terms for longitude (simplified from Meeus Table 47.A).
+    # Repeated argument multiples are hoisted and the terms summed in a
+    # single expression rather than 24 separate accumulations.
+    sin = math.sin
+    D2 = 2 * D_rad
+    D4 = 4 * D_rad
+    Mp2 = 2 * Mp_rad
+    F2 = 2 * F_rad
+    return (
+        6288774 * sin(Mp_rad)
+        + 1274027 * sin(D2 - Mp_rad)
+        + 658314 * sin(D2)
+        + 213618 * sin(Mp2)
+        - 185116 * sin(M_rad)
+        - 114332 * sin(F2)
+        + 58793 * sin(D2 - Mp2)
+        + 57066 * sin(D2 - M_rad - Mp_rad)
+        + 53322 * sin(D2 + Mp_rad)
+        + 45758 * sin(D2 - M_rad)
+        - 40923 * sin(M_rad - Mp_rad)
+        - 34720 * sin(D_rad)
+        - 30383 * sin(M_rad + Mp_rad)
+        + 15327 * sin(D2 - F2)
+        - 12528 * sin(Mp_rad + F2)
+        + 10980 * sin(Mp_rad - F2)
+        + 10675 * sin(D4 - Mp_rad)
+        + 10034 * sin(3 * Mp_rad)
+        + 8548 * sin(D4 - Mp2)
+        - 7888 * sin(D2 + M_rad - Mp_rad)
+        - 6766 * sin(D2 + M_rad)
+        - 5163 * sin(D_rad - Mp_rad)
+        + 4987 * sin(D_rad + M_rad)
+        + 4036 * sin(D2 - M_rad + Mp_rad)
+    )
+
+
+# The pure-Python series, kept for comparison with the compiled one
+_moon_series_python = _moon_series
+
+try:  # optional Cython build of the series above, see _astrology_core.pyx
+    import elizaos_plugin_mysticism.engines._astrology_core as _core  # type: ignore[import-not-found]
+except ImportError:
+    pass
+else:
+    _moon_series = _core.moon_series
+
+
+def reset_cache() -> None:
+    """Clear the memoised longitude and chart caches."""
+    _natal_chart_cached.cache_clear()
+    _earth_helio.cache_clear()
+    _geocentric_longitude_cached.cache_clear()
+    _geocentric_longitudes.cache_clear()
+    sun_longitude.cache_clear()
+    moon_longitude.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Retrograde detection
 # ---------------------------------------------------------------------------
 
 
+def _retrograde_flags(jd: float) -> tuple[bool, ...]:
+    """Retrograde flag per ``_GEO_PLANETS`` entry, comparing longitude ±1 day."""
+    before = _geocentric_longitudes(jd - 1)
+    after = _geocentric_longitudes(jd + 1)
+    # Fold the daily motion into [-180, 180) to handle wrapping around 0/360
+    return tuple((a - b + 540.0) % 360.0 - 180.0 < 0 for b, a in zip(before, after))
+
+
 def _is_retrograde(planet_id: str, jd: float) -> bool:
     """Determine if a planet appears retrograde by comparing longitude ±1 day."""
     if planet_id in ("sun", "moon"):
         return False
-
-    lon_before = geocentric_longitude(planet_id, jd - 1)
-    lon_after = geocentric_longitude(planet_id, jd + 1)
-
-    # Handle wrapping around 0/360 degrees
-    diff = lon_after - lon_before
-    if diff > 180:
-        diff -= 360
-    if diff < -180:
-        diff += 360
-
-    return diff < 0
+    return _retrograde_flags(jd)[_GEO_PLANETS.index(planet_id)]
 
 
 # ---------------------------------------------------------------------------
@@ -497,12 +615,7 @@ def _is_retrograde(planet_id: str, jd: float) -> bool:
 def _obliquity(jd: float) -> float:
     """Mean obliquity of the ecliptic (Laskar formula)."""
     T = julian_centuries(jd)
-    return (
-        23.4392911
-        - 0.0130042 * T
-        - 1.64e-7 * T * T
-        + 5.036e-7 * T * T * T
-    )
+    return ((5.036e-7 * T - 1.64e-7) * T - 0.0130042) * T + 23.4392911
 
 
 # ---------------------------------------------------------------------------
@@ -517,35 +630,57 @@ def _local_sidereal_time(jd: float, lon_deg: float) -> float:
     gmst = _norm_deg(
         280.46061837
         + 360.98564736629 * (jd - J2000)
-        + 0.000387933 * T * T
-        - T * T * T / 38710000
+        + (-1.0 / 38710000 * T + 0.000387933) * T * T
     )
     return _norm_deg(gmst + lon_deg)
 
 
+def _ascendant_from(
+    sin_lst: float, cos_lst: float, sin_obl: float, cos_obl: float, lat_deg: float
+) -> float:
+    """Ascendant in degrees from precomputed sines and cosines of LST and obliquity."""
+    asc = math.atan2(-cos_lst, sin_obl * math.tan(lat_deg * DEG2RAD) + cos_obl * sin_lst)
+    return _norm_deg(asc * RAD2DEG)
+
+
+def _midheaven_from(sin_lst: float, cos_lst: float, cos_obl: float) -> float:
+    """Midheaven in degrees from precomputed sines and cosines of LST and obliquity."""
+    mc = math.atan2(sin_lst, cos_lst * cos_obl)
+    return _norm_deg(mc * RAD2DEG)
+
+
 def compute_ascendant(lst_deg: float, lat_deg: float, obl_deg: float) -> float:
     """Calculate the Ascendant (rising sign) from LST, latitude, and obliquity."""
     lst_rad = lst_deg * DEG2RAD
-    lat_rad = lat_deg * DEG2RAD
     obl_rad = obl_deg * DEG2RAD
-
-    y = -math.cos(lst_rad)
-    x = math.sin(obl_rad) * math.tan(lat_rad) + math.cos(obl_rad) * math.sin(lst_rad)
-
-    asc = math.atan2(y, x) * RAD2DEG
-    return _norm_deg(asc)
+    return _ascendant_from(
+        math.sin(lst_rad), math.cos(lst_rad), math.sin(obl_rad), math.cos(obl_rad), lat_deg
+    )
 
 
 def compute_midheaven(lst_deg: float, obl_deg: float) -> float:
     """Calculate the Midheaven (Medium Coeli) from LST and obliquity."""
     lst_rad = lst_deg * DEG2RAD
-    obl_rad = obl_deg * DEG2RAD
+    return _midheaven_from(math.sin(lst_rad), math.cos(lst_rad), math.cos(obl_deg * DEG2RAD))
+
 
-    mc = math.atan2(
-        math.sin(lst_rad),
-        math.cos(lst_rad) * math.cos(obl_rad),
-    ) * RAD2DEG
-    return _norm_deg(mc)
+def _ascendant_midheaven(
+    lst_deg: float, lat_deg: float, obl_deg: float
+) -> tuple[float, float]:
+    """:func:`compute_ascendant` and :func:`compute_midheaven` in one pass.
+
+    Both angles use the sine and cosine of LST and obliquity; they are
+    evaluated once here instead of once per function.
+    """
+    lst_rad = lst_deg * DEG2RAD
+    obl_rad = obl_deg * DEG2RAD
+    sin_lst = math.sin(lst_rad)
+    cos_lst = math.cos(lst_rad)
+    cos_obl = math.cos(obl_rad)
+    return (
+        _ascendant_from(sin_lst, cos_lst, math.sin(obl_rad), cos_obl, lat_deg),
+        _midheaven_from(sin_lst, cos_lst, cos_obl),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -553,12 +688,12 @@ def compute_midheaven(lst_deg: float, obl_deg: float) -> float:
 # ---------------------------------------------------------------------------
 
 
-def _equal_house_cusps(asc_deg: float) -> list[float]:
+def _equal_house_cusps(asc_deg: float) -> tuple[float, ...]:
     """Calculate equal house cusps from the Ascendant (each house = 30 deg)."""
-    return [_norm_deg(asc_deg + i * 30) for i in range(12)]
+    return tuple(_norm_deg(asc_deg + i * 30) for i in range(12))
 
 
-def _house_for_longitude(longitude: float, cusps: list[float]) -> int:
+def _house_for_longitude(longitude: float, cusps: tuple[float, ...]) -> int:
     """Determine which house (1-12) a planet falls in."""
     for i in range(12):
         cusp = cusps[i]
@@ -579,32 +714,29 @@ def _house_for_longitude(longitude: float, cusps: list[float]) -> int:
 # Sun sign from date (calendar-based, traditional boundaries)
 # ---------------------------------------------------------------------------
 
-_SUN_SIGN_DATES: list[dict[str, object]] = [
-    {"sign": "capricorn",   "startMonth": 1,  "startDay": 1},
-    {"sign": "aquarius",    "startMonth": 1,  "startDay": 20},
-    {"sign": "pisces",      "startMonth": 2,  "startDay": 19},
-    {"sign": "aries",       "startMonth": 3,  "startDay": 21},
-    {"sign": "taurus",      "startMonth": 4,  "startDay": 20},
-    {"sign": "gemini",      "startMonth": 5,  "startDay": 21},
-    {"sign": "cancer",      "startMonth": 6,  "startDay": 21},
-    {"sign": "leo",         "startMonth": 7,  "startDay": 23},
-    {"sign": "virgo",       "startMonth": 8,  "startDay": 23},
-    {"sign": "libra",       "startMonth": 9,  "startDay": 23},
-    {"sign": "scorpio",     "startMonth": 10, "startDay": 23},
-    {"sign": "sagittarius", "startMonth": 11, "startDay": 22},
-    {"sign": "capricorn",   "startMonth": 12, "startDay": 22},
-]
+# Indexed by month - 1: (cusp day, sign before the cusp, sign from the cusp on)
+_SUN_SIGN_CUSPS: tuple[tuple[int, str, str], ...] = (
+    (20, "capricorn",   "aquarius"),
+    (19, "aquarius",    "pisces"),
+    (21, "pisces",      "aries"),
+    (20, "aries",       "taurus"),
+    (21, "taurus",      "gemini"),
+    (21, "gemini",      "cancer"),
+    (23, "cancer",      "leo"),
+    (23, "leo",         "virgo"),
+    (23, "virgo",       "libra"),
+    (23, "libra",       "scorpio"),
+    (22, "scorpio",     "sagittarius"),
+    (22, "sagittarius", "capricorn"),
+)
 
 
 def calculate_sun_sign(month: int, day: int) -> str:
     """Determine the Sun sign from month and day using traditional boundaries."""
-    for boundary in reversed(_SUN_SIGN_DATES):
-        start_month = boundary["startMonth"]
-        start_day = boundary["startDay"]
-        assert isinstance(start_month, int) and isinstance(start_day, int)
-        if month > start_month or (month == start_month and day >= start_day):
-            return str(boundary["sign"])
-    return "capricorn"
+    if not 1 <= month <= 12:
+        return "capricorn"
+    cusp_day, before, after = _SUN_SIGN_CUSPS[month - 1]
+    return after if day >= cusp_day else before
 
 
 # ---------------------------------------------------------------------------
@@ -614,33 +746,41 @@ def calculate_sun_sign(month: int, day: int) -> str:
 
 def calculate_aspects(positions: list[PlanetPosition]) -> list[ChartAspect]:
     """Calculate all aspects between planet positions."""
-    aspects: list[ChartAspect] = []
-    definitions = _load_aspect_definitions()
-
-    for i in range(len(positions)):
-        for j in range(i + 1, len(positions)):
-            p1 = positions[i]
-            p2 = positions[j]
-
-            separation = abs(p1.totalDegrees - p2.totalDegrees)
-            if separation > 180:
-                separation = 360 - separation
-
-            for defn in definitions:
-                orb_distance = abs(separation - defn["degrees"])
-                if orb_distance <= defn["orb"]:
-                    aspects.append(
-                        ChartAspect(
-                            planet1=p1.planet,
-                            planet2=p2.planet,
-                            aspectName=defn["name"],
-                            aspectSymbol=defn["symbol"],
-                            exactDegrees=defn["degrees"],
-                            actualDegrees=separation,
-                            orb=round(orb_distance * 100) / 100,
-                            nature=defn["nature"],
-                        )
-                    )
+    exact = _DEF_DEG
+    orbs = _DEF_ORB
+    lon = [p.totalDegrees for p in positions]
+    n = len(lon)
+
+    # Fold every pairwise separation into [0, 180] once
+    pairs: list[tuple[int, int, float]] = []
+    for i in range(n):
+        lon_i = lon[i]
+        for j in range(i + 1, n):
+            sep = abs(lon_i - lon[j])
+            pairs.append((i, j, 360 - sep if sep > 180 else sep))
+
+    # Match each pair against the candidate definitions for its degree bucket
+    buckets = _DEF_BUCKETS
+    matches = [
+        (i, j, sep, k)
+        for i, j, sep in pairs
+        for k in buckets[int(sep)]
+        if abs(sep - exact[k]) <= orbs[k]
+    ]
+
+    aspects = [
+        ChartAspect(
+            planet1=positions[i].planet,
+            planet2=positions[j].planet,
+            aspectName=_DEF_NAME[k],
+            aspectSymbol=_DEF_SYMBOL[k],
+            exactDegrees=exact[k],
+            actualDegrees=sep,
+            orb=round(abs(sep - exact[k]) * 100) / 100,
+            nature=_DEF_NATURE[k],
+        )
+        for i, j, sep, k in matches
+    ]
 
     # Sort by tightest orb first
     aspects.sort(key=lambda a: a.orb)
@@ -655,15 +795,15 @@ def calculate_aspects(positions: list[PlanetPosition]) -> list[ChartAspect]:
 def _build_position(
     planet_name: str,
     longitude: float,
-    house_cusps: list[float],
+    house_cusps: tuple[float, ...],
     retrograde: bool,
 ) -> PlanetPosition:
-    sign_pos = degrees_to_sign(longitude)
+    sign, within_sign, deg = _sign_triple(longitude)
     return PlanetPosition(
         planet=planet_name,
-        sign=sign_pos.sign,
-        degrees=round(sign_pos.degrees * 100) / 100,
-        totalDegrees=round(sign_pos.totalDegrees * 100) / 100,
+        sign=sign,
+        degrees=round(within_sign * 100) / 100,
+        totalDegrees=round(deg * 100) / 100,
         house=_house_for_longitude(longitude, house_cusps),
         retrograde=retrograde,
     )
@@ -679,7 +819,36 @@ def calculate_natal_chart(birth_data: BirthData) -> NatalChart:
 
     For BirthData with null fields: default hour to 12, minute to 0,
     lat/lon to 0/0, timezone to 0 (same as TypeScript service does).
+
+    Charts are memoised per ``BirthData``, so repeated calls return the same
+    ``NatalChart`` instance; treat it as read-only.
     """
+    return _natal_chart_cached(birth_data)
+
+
+@lru_cache(maxsize=1024)
+def _natal_chart_cached(birth_data: BirthData) -> NatalChart:
+    return _natal_chart(birth_data)
+
+
+def calculate_natal_charts_batch(
+    birth_data_list: Iterable[BirthData],
+    max_workers: Optional[int] = None,
+) -> list[NatalChart]:
+    """Calculate natal charts for many birth data records.
+
+    Charts are independent, so with ``max_workers > 1`` the batch is split
+    across that many worker processes; results keep the input order.
+    """
+    births = list(birth_data_list)
+    if max_workers is None or max_workers <= 1 or len(births) <= 1:
+        return [_natal_chart(bd) for bd in births]
+    chunksize = max(1, len(births) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_natal_chart, births, chunksize=chunksize))
+
+
+def _natal_chart(birth_data: BirthData) -> NatalChart:
     # Apply defaults for nullable fields
     day = birth_data.day if birth_data.day is not None else 1
     hour = birth_data.hour if birth_data.hour is not None else 12
@@ -702,8 +871,7 @@ def calculate_natal_chart(birth_data: BirthData) -> NatalChart:
     lst = _local_sidereal_time(jd, longitude_geo)
 
     # Ascendant and Midheaven
-    asc_deg = compute_ascendant(lst, latitude, obl)
-    mc_deg = compute_midheaven(lst, obl)
+    asc_deg, mc_deg = _ascendant_midheaven(lst, latitude, obl)
 
     # House cusps (equal house system)
     cusps = _equal_house_cusps(asc_deg)
@@ -711,26 +879,16 @@ def calculate_natal_chart(birth_data: BirthData) -> NatalChart:
     # Compute planetary positions
     sun_lon = sun_longitude(jd)
     moon_lon = moon_longitude(jd)
-    mercury_lon = geocentric_longitude("mercury", jd)
-    venus_lon = geocentric_longitude("venus", jd)
-    mars_lon = geocentric_longitude("mars", jd)
-    jupiter_lon = geocentric_longitude("jupiter", jd)
-    saturn_lon = geocentric_longitude("saturn", jd)
-    uranus_lon = geocentric_longitude("uranus", jd)
-    neptune_lon = geocentric_longitude("neptune", jd)
-    pluto_lon = geocentric_longitude("pluto", jd)
+    planet_lons = _geocentric_longitudes(jd)
+    retrograde = _retrograde_flags(jd)
 
     # Build planet positions
     sun = _build_position("sun", sun_lon, cusps, False)
     moon = _build_position("moon", moon_lon, cusps, False)
-    mercury = _build_position("mercury", mercury_lon, cusps, _is_retrograde("mercury", jd))
-    venus = _build_position("venus", venus_lon, cusps, _is_retrograde("venus", jd))
-    mars = _build_position("mars", mars_lon, cusps, _is_retrograde("mars", jd))
-    jupiter = _build_position("jupiter", jupiter_lon, cusps, _is_retrograde("jupiter", jd))
-    saturn = _build_position("saturn", saturn_lon, cusps, _is_retrograde("saturn", jd))
-    uranus = _build_position("uranus", uranus_lon, cusps, _is_retrograde("uranus", jd))
-    neptune = _build_position("neptune", neptune_lon, cusps, _is_retrograde("neptune", jd))
-    pluto = _build_position("pluto", pluto_lon, cusps, _is_retrograde("pluto", jd))
+    mercury, venus, mars, jupiter, saturn, uranus, neptune, pluto = (
+        _build_position(planet_id, lon, cusps, retro)
+        for planet_id, lon, retro in zip(_GEO_PLANETS, planet_lons, retrograde)
+    )
 
     # Ascendant and Midheaven as SignPositions
     ascendant = degrees_to_sign(asc_deg)
@@ -753,7 +911,7 @@ def calculate_natal_chart(birth_data: BirthData) -> NatalChart:
         pluto=pluto,
         ascendant=ascendant,
         midheaven=midheaven,
-        aspects=aspects,
+        aspects=tuple(aspects),
         houseCusps=cusps,
     )
 
@@ -781,9 +939,9 @@ class AstrologyEngine:
         return AstrologyReadingState(
             birthData=birth_data,
             chart=chart,
-            revealedPlanets=[],
-            revealedHouses=[],
-            userFeedback=[],
+            revealedPlanets=(),
+            revealedHouses=(),
+            userFeedback=(),
         )
 
     def get_next_reveal(
@@ -807,9 +965,9 @@ class AstrologyEngine:
         return AstrologyReadingState(
             birthData=state.birthData,
             chart=state.chart,
-            revealedPlanets=[*state.revealedPlanets, planet_id],
-            revealedHouses=list(state.revealedHouses),
-            userFeedback=[*state.userFeedback, feedback],
+            revealedPlanets=state.revealedPlanets + (planet_id,),
+            revealedHouses=state.revealedHouses,
+            userFeedback=state.userFeedback + (feedback,),
         )
 
     def get_synthesis(self, state: AstrologyReadingState) -> dict:
@@ -821,10 +979,7 @@ class AstrologyEngine:
             "ascendant": chart.ascendant.sign,
             "planets": {
                 p.planet: {"sign": p.sign, "degrees": p.degrees, "house": p.house}
-                for p in [
-                    chart.sun, chart.moon, chart.mercury, chart.venus, chart.mars,
-                    chart.jupiter, chart.saturn, chart.uranus, chart.neptune, chart.pluto,
-                ]
+                for p in chart.planets
             },
             "aspects": [
                 {
@@ -1,16 +1,24 @@
 """I Ching divination engine — Python port of typescript/src/engines/iching/.
 
-Uses the three-coin method with cryptographic randomness (``secrets``).
+Uses the three-coin method with cryptographic randomness (``secrets``); the
+casting functions accept an optional ``random.Random`` (``rng``) instead, e.g.
+a seeded one for reproducible readings.
 All reading state is external (``IChingReadingState``); the engine is stateless.
 """
 
 from __future__ import annotations
 
-import json
+import os
+import random
 import secrets
+import sys
+import threading
+from array import array
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from elizaos_plugin_mysticism.engines._datacache import load_json
 from elizaos_plugin_mysticism.types import (
     CastResult,
     FeedbackEntry,
@@ -35,8 +43,10 @@ def _load_trigrams() -> list[Trigram]:
     if _trigrams_cache is not None:
         return _trigrams_cache
     path = _DATA_DIR / "iching" / "trigrams.json"
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json(path)
+    for t in raw:
+        # Several trigrams share an element; keep one string per element
+        t["element"] = sys.intern(t["element"])
     _trigrams_cache = [Trigram(**t) for t in raw]
     return _trigrams_cache
 
@@ -46,8 +56,7 @@ def _load_hexagrams() -> list[Hexagram]:
     if _hexagrams_cache is not None:
         return _hexagrams_cache
     path = _DATA_DIR / "iching" / "hexagrams.json"
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json(path)
     result: list[Hexagram] = []
     for h in raw:
         lines = [HexagramLine(**ln) for ln in h["lines"]]
@@ -72,23 +81,30 @@ def _load_hexagrams() -> list[Hexagram]:
 
 
 # ---------------------------------------------------------------------------
-# Lookup maps (lazily built)
+# Lookup maps (built at import)
 # ---------------------------------------------------------------------------
 
-_trigram_by_number: Optional[dict[int, Trigram]] = None
-_hexagram_by_number: Optional[dict[int, Hexagram]] = None
-_binary_to_number: Optional[dict[str, int]] = None
+_trigram_by_number: dict[int, Trigram] = {}
+_hexagram_by_number: dict[int, Hexagram] = {}
+# Hexagram number indexed by the 6-bit value of its binary string (bottom
+# line = most significant bit); 0 marks an unused pattern.
+_binary_int_to_number = array("B", bytes(64))
+# Hexagram number by binary string, for lookups that start from the string
+_binary_to_number: dict[str, int] = {}
 
 
 def _build_lookups() -> None:
-    global _trigram_by_number, _hexagram_by_number, _binary_to_number
-    if _trigram_by_number is not None:
-        return
     trigs = _load_trigrams()
     hexes = _load_hexagrams()
-    _trigram_by_number = {t.number: t for t in trigs}
-    _hexagram_by_number = {h.number: h for h in hexes}
-    _binary_to_number = {h.binary: h.number for h in hexes}
+    _trigram_by_number.update((t.number, t) for t in trigs)
+    _hexagram_by_number.update((h.number, h) for h in hexes)
+    for h in hexes:
+        _binary_int_to_number[h.binaryInt] = h.number
+        _binary_to_number[h.binary] = h.number
+
+
+# Build once now so the lookup functions don't re-check on every call
+_build_lookups()
 
 
 # ---------------------------------------------------------------------------
@@ -96,14 +112,48 @@ def _build_lookups() -> None:
 # ---------------------------------------------------------------------------
 
 
-def _flip_coin() -> bool:
-    """Return True (heads) or False (tails) with cryptographic randomness."""
-    return secrets.randbelow(2) >= 1
+# Coin bits are drained from a pool refilled _POOL_BYTES at a time, so one
+# secrets call covers many casts. Guarded by a lock for concurrent readings.
+_POOL_BYTES = 64
+_pool_lock = threading.Lock()
+_pool = 0
+_pool_bits = 0
+
+
+def _coin_bits(count: int) -> int:
+    """Return *count* (at most ``8 * _POOL_BYTES``) random coin bits."""
+    global _pool, _pool_bits
+    with _pool_lock:
+        if _pool_bits < count:
+            _pool = int.from_bytes(secrets.token_bytes(_POOL_BYTES), "little")
+            _pool_bits = 8 * _POOL_BYTES
+        bits = _pool & ((1 << count) - 1)
+        _pool >>= count
+        _pool_bits -= count
+    return bits
+
+
+def _reset_pool() -> None:
+    # A forked child must not replay the parent's remaining bits, nor inherit
+    # the lock held by a parent thread that was mid-draw at fork time
+    global _pool_lock, _pool, _pool_bits
+    _pool_lock = threading.Lock()
+    _pool = 0
+    _pool_bits = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
+
 
+# Bit (value - 6) is set for the changing values 6 and 9
+_CHANGING_VALUES = 0b1001
 
-def _cast_line() -> tuple[int, bool]:
+
+def _cast_line(coins: int) -> tuple[int, bool]:
     """Cast a single I Ching line using the three-coin method.
 
+    ``coins`` holds three random bits, one per coin: set = heads.
     Heads = 3, Tails = 2.
     Sum determines line type:
       6 (2+2+2) = Old Yin   (changing broken line)
@@ -114,25 +164,36 @@ def _cast_line() -> tuple[int, bool]:
     Returns:
         (value, changing) tuple.
     """
-    coin1 = 3 if _flip_coin() else 2
-    coin2 = 3 if _flip_coin() else 2
-    coin3 = 3 if _flip_coin() else 2
-    value = coin1 + coin2 + coin3
-    return value, (value == 6 or value == 9)
-
+    value = 6 + coins.bit_count()
+    return value, (_CHANGING_VALUES >> (value - 6)) & 1 == 1
 
-def _line_value_to_binary(value: int) -> int:
-    """7 and 9 are yang (solid) -> 1; 6 and 8 are yin (broken) -> 0."""
-    return 1 if value in (7, 9) else 0
 
+def _cast_trigram_lines(coins: int) -> tuple[tuple[int, ...], int, int]:
+    """Cast three lines (bottom to top) from 9 coin bits.
 
-def _line_value_to_transformed_binary(value: int) -> int:
-    """Transform changing lines: Old Yin (6) -> Yang (1), Old Yang (9) -> Yin (0)."""
-    if value == 6:
-        return 1  # Old Yin -> Yang
-    if value == 9:
-        return 0  # Old Yang -> Yin
-    return _line_value_to_binary(value)
+    Returns:
+        (values, yang bits, changing bits); the bottom line is the most
+        significant of the three bits.
+    """
+    values: list[int] = []
+    yang = 0
+    changing = 0
+    for shift in (0, 3, 6):
+        value, line_changing = _cast_line((coins >> shift) & 7)
+        values.append(value)
+        yang = (yang << 1) | (value & 1)
+        changing = (changing << 1) | line_changing
+    return tuple(values), yang, changing
+
+
+# Every outcome of casting three lines, indexed by their 9 coin bits, so a
+# hexagram is cast with two lookups instead of six per-line computations.
+_TRIGRAM_CASTS = tuple(_cast_trigram_lines(coins) for coins in range(512))
+
+# Changing line positions (1-6, ascending) for each 6-bit changing mask
+_CHANGING_POSITIONS = tuple(
+    tuple(i + 1 for i in range(6) if (mask >> (5 - i)) & 1) for mask in range(64)
+)
 
 
 # ---------------------------------------------------------------------------
@@ -140,29 +201,49 @@ def _line_value_to_transformed_binary(value: int) -> int:
 # ---------------------------------------------------------------------------
 
 
-def cast_hexagram() -> CastResult:
+def cast_hexagram(rng: Optional[random.Random] = None) -> CastResult:
     """Cast a full hexagram (6 lines, bottom to top)."""
-    _build_lookups()
-
-    cast_lines: list[tuple[int, bool]] = []
-    for _ in range(6):
-        cast_lines.append(_cast_line())
-
-    lines = [cl[0] for cl in cast_lines]
-    changing_lines = [i + 1 for i, cl in enumerate(cast_lines) if cl[1]]
-
-    # Build binary string (bottom to top = left to right)
-    binary = "".join(str(_line_value_to_binary(cl[0])) for cl in cast_lines)
-    hexagram_number = binary_to_hexagram_number(binary)
+    bits = _coin_bits(18) if rng is None else rng.getrandbits(18)
+    return _cast_from_bits(bits)
+
+
+def cast_hexagram_batch(
+    n: int, rng: Optional[random.Random] = None
+) -> list[CastResult]:
+    """Cast *n* independent hexagrams from a single ``secrets`` (or *rng*) draw."""
+    if n < 0:
+        raise ValueError("Cast count must be non-negative")
+    bits = secrets.randbits(18 * n) if rng is None else rng.getrandbits(18 * n)
+    casts = []
+    for _ in range(n):
+        casts.append(_cast_from_bits(bits & 0x3FFFF))
+        bits >>= 18
+    return casts
+
+
+def _cast_from_bits(bits: int) -> CastResult:
+    """Cast a hexagram from 18 coin bits, three per line."""
+    # Bottom to top = most to least significant, matching the left-to-right
+    # binary string. A line's yang bit is the low bit of its value (7, 9 -> 1;
+    # 6, 8 -> 0), and a changing line flips it.
+    lower_lines, lower_yang, lower_changing = _TRIGRAM_CASTS[bits & 0x1FF]
+    upper_lines, upper_yang, upper_changing = _TRIGRAM_CASTS[bits >> 9]
+    lines = lower_lines + upper_lines
+    binary_int = (lower_yang << 3) | upper_yang
+    changing_mask = (lower_changing << 3) | upper_changing
+    # Ascending by construction; the engine relies on this order
+    changing_lines = _CHANGING_POSITIONS[changing_mask]
+
+    binary = format(binary_int, "06b")
+    hexagram_number = _hexagram_number_from_int(binary_int)
 
     transformed_hexagram_number: Optional[int] = None
     transformed_binary: Optional[str] = None
 
-    if changing_lines:
-        transformed_binary = "".join(
-            str(_line_value_to_transformed_binary(cl[0])) for cl in cast_lines
-        )
-        transformed_hexagram_number = binary_to_hexagram_number(transformed_binary)
+    if changing_mask:
+        transformed_int = binary_int ^ changing_mask
+        transformed_binary = format(transformed_int, "06b")
+        transformed_hexagram_number = _hexagram_number_from_int(transformed_int)
 
     return CastResult(
         lines=lines,
@@ -176,32 +257,38 @@ def cast_hexagram() -> CastResult:
 
 def binary_to_hexagram_number(binary: str) -> int:
     """Look up hexagram number from its 6-digit binary representation."""
-    _build_lookups()
-    assert _binary_to_number is not None
-    number = _binary_to_number.get(binary)
-    if number is None:
-        raise ValueError(f"Unknown hexagram binary pattern: {binary}")
+    try:
+        return _binary_to_number[binary]
+    except KeyError:
+        raise ValueError(f"Unknown hexagram binary pattern: {binary}") from None
+
+
+def _hexagram_number_from_int(binary_int: int) -> int:
+    """Look up hexagram number from its 6-bit integer value."""
+    number = _binary_int_to_number[binary_int]
+    if not number:
+        raise ValueError(f"Unknown hexagram binary pattern: {binary_int:06b}")
     return number
 
 
 def get_hexagram(number: int) -> Hexagram:
     """Look up a hexagram by its King Wen number (1-64)."""
-    _build_lookups()
-    assert _hexagram_by_number is not None
-    hexagram = _hexagram_by_number.get(number)
-    if hexagram is None:
-        raise ValueError(f"Hexagram number {number} not found (valid range: 1-64)")
-    return hexagram
+    try:
+        return _hexagram_by_number[number]
+    except KeyError:
+        raise ValueError(
+            f"Hexagram number {number} not found (valid range: 1-64)"
+        ) from None
 
 
 def get_trigram(number: int) -> Trigram:
     """Look up a trigram by number (1-8)."""
-    _build_lookups()
-    assert _trigram_by_number is not None
-    trigram = _trigram_by_number.get(number)
-    if trigram is None:
-        raise ValueError(f"Trigram number {number} not found (valid range: 1-8)")
-    return trigram
+    try:
+        return _trigram_by_number[number]
+    except KeyError:
+        raise ValueError(
+            f"Trigram number {number} not found (valid range: 1-8)"
+        ) from None
 
 
 def get_lower_trigram(hexagram: Hexagram) -> Trigram:
@@ -218,10 +305,19 @@ def get_upper_trigram(hexagram: Hexagram) -> Trigram:
 
 
 class IChingEngine:
-    """Stateless I Ching engine — all reading state lives in IChingReadingState."""
+    """Stateless I Ching engine — all reading state lives in IChingReadingState.
 
-    def start_reading(self, question: str) -> IChingReadingState:
-        cast_result = cast_hexagram()
+    ``rng`` is used for every reading that does not pass its own; by default
+    readings use ``secrets``.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng = rng
+
+    def start_reading(
+        self, question: str, rng: Optional[random.Random] = None
+    ) -> IChingReadingState:
+        cast_result = cast_hexagram(rng if rng is not None else self._rng)
         hexagram = get_hexagram(cast_result.hexagramNumber)
 
         transformed_hexagram: Optional[Hexagram] = None
@@ -234,7 +330,7 @@ class IChingEngine:
             hexagram=hexagram,
             transformedHexagram=transformed_hexagram,
             revealedLines=0,
-            userFeedback=[],
+            userFeedback=(),
         )
 
     def get_next_reveal(
@@ -242,12 +338,12 @@ class IChingEngine:
         state: IChingReadingState,
     ) -> Optional[dict]:
         """Return the next changing line to reveal, or None when done."""
-        sorted_changing = sorted(state.castResult.changingLines)
+        changing = state.castResult.changingLines  # already ascending
 
-        if state.revealedLines >= len(sorted_changing):
+        if state.revealedLines >= len(changing):
             return None
 
-        line_position = sorted_changing[state.revealedLines]
+        line_position = changing[state.revealedLines]
         return {"linePosition": line_position}
 
     def record_feedback(
@@ -261,7 +357,7 @@ class IChingEngine:
             hexagram=state.hexagram,
             transformedHexagram=state.transformedHexagram,
             revealedLines=state.revealedLines + 1,
-            userFeedback=[*state.userFeedback, feedback],
+            userFeedback=state.userFeedback + (feedback,),
         )
 
     def get_synthesis(self, state: IChingReadingState) -> dict:
@@ -281,7 +377,7 @@ class IChingEngine:
                 if state.transformedHexagram
                 else None
             ),
-            "changingLines": state.castResult.changingLines,
+            "changingLines": list(state.castResult.changingLines),
             "question": state.question,
             "feedback": [
                 {"element": fb.element, "userText": fb.userText}
@@ -290,37 +386,52 @@ class IChingEngine:
         }
 
     def is_complete(self, state: IChingReadingState) -> bool:
-        sorted_changing = sorted(state.castResult.changingLines)
-        return state.revealedLines >= len(sorted_changing)
+        return state.revealedLines >= len(state.castResult.changingLines)
 
     def get_casting_summary(self, state: IChingReadingState) -> str:
         """Human-readable summary of the cast."""
-        hexagram = state.hexagram
-        cast_result = state.castResult
         transformed = state.transformedHexagram
+        return _casting_summary(
+            state.hexagram.number,
+            transformed.number if transformed else None,
+            state.castResult.changingLines,
+        )
+
+
+@lru_cache(maxsize=128)
+def _casting_summary(
+    hexagram_number: int,
+    transformed_number: Optional[int],
+    changing_lines: tuple[int, ...],
+) -> str:
+    """Casting summary text; a pure function of the cast, so memoised."""
+    hexagram = get_hexagram(hexagram_number)
+    transformed = (
+        get_hexagram(transformed_number) if transformed_number is not None else None
+    )
 
-        upper = get_upper_trigram(hexagram)
-        lower = get_lower_trigram(hexagram)
+    upper = get_upper_trigram(hexagram)
+    lower = get_lower_trigram(hexagram)
 
-        parts: list[str] = [
-            f"{hexagram.character} Hexagram {hexagram.number}: "
-            f"{hexagram.name} — {hexagram.englishName}",
+    parts: list[str] = [
+        f"{hexagram.character} Hexagram {hexagram.number}: "
+        f"{hexagram.name} — {hexagram.englishName}",
+        "",
+        f"Upper: {upper.character} {upper.englishName} ({upper.image})",
+        f"Lower: {lower.character} {lower.englishName} ({lower.image})",
+    ]
+
+    if changing_lines:
+        lines_str = ", ".join(f"Line {l}" for l in changing_lines)
+        parts.extend(["", f"Changing lines: {lines_str}"])
+    else:
+        parts.extend(["", "No changing lines — the reading is stable."])
+
+    if transformed:
+        parts.extend([
             "",
-            f"Upper: {upper.character} {upper.englishName} ({upper.image})",
-            f"Lower: {lower.character} {lower.englishName} ({lower.image})",
-        ]
-
-        if cast_result.changingLines:
-            lines_str = ", ".join(f"Line {l}" for l in cast_result.changingLines)
-            parts.extend(["", f"Changing lines: {lines_str}"])
-        else:
-            parts.extend(["", "No changing lines — the reading is stable."])
-
-        if transformed:
-            parts.extend([
-                "",
-                f"Transforming to: {transformed.character} Hexagram "
-                f"{transformed.number}: {transformed.name} — {transformed.englishName}",
-            ])
-
-        return "\n".join(parts)
+            f"Transforming to: {transformed.character} Hexagram "
+            f"{transformed.number}: {transformed.name} — {transformed.englishName}",
+        ])
+
+    return "\n".join(parts)
@@ -1,17 +1,22 @@
 """Tarot divination engine — Python port of typescript/src/engines/tarot/.
 
-Uses Fisher-Yates shuffle with cryptographic randomness (``secrets``).
+Uses Fisher-Yates shuffle with cryptographic randomness (``secrets``); the
+shuffle and draw functions accept an optional ``random.Random`` (``rng``)
+instead, e.g. a seeded one for reproducible readings.
 All reading state is external (``TarotReadingState``); the engine is stateless.
 """
 
 from __future__ import annotations
 
-import json
+import random
 import secrets
-from copy import deepcopy
+import struct
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+from elizaos_plugin_mysticism.engines._datacache import load_json
 from elizaos_plugin_mysticism.types import (
     DrawnCard,
     FeedbackEntry,
@@ -29,6 +34,11 @@ _DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data"
 
 _cards_cache: Optional[list[TarotCard]] = None
 _spreads_cache: Optional[list[SpreadDefinition]] = None
+_spreads_by_id: dict[str, SpreadDefinition] = {}
+
+# Card fields drawn from a handful of values; interned so the 78 cards share
+# one string object per value.
+_INTERNED_CARD_FIELDS = ("arcana", "suit", "element", "planet", "zodiac")
 
 
 def _load_cards() -> list[TarotCard]:
@@ -36,19 +46,21 @@ def _load_cards() -> list[TarotCard]:
     if _cards_cache is not None:
         return _cards_cache
     path = _DATA_DIR / "tarot" / "cards.json"
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json(path)
+    for card in raw:
+        for key in _INTERNED_CARD_FIELDS:
+            if card[key] is not None:
+                card[key] = sys.intern(card[key])
     _cards_cache = [TarotCard(**card) for card in raw]
     return _cards_cache
 
 
 def _load_spreads() -> list[SpreadDefinition]:
-    global _spreads_cache
+    global _spreads_cache, _spreads_by_id
     if _spreads_cache is not None:
         return _spreads_cache
     path = _DATA_DIR / "tarot" / "spreads.json"
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    raw = load_json(path)
     result: list[SpreadDefinition] = []
     for s in raw:
         positions = [SpreadPosition(**p) for p in s["positions"]]
@@ -62,49 +74,172 @@ def _load_spreads() -> list[SpreadDefinition]:
             )
         )
     _spreads_cache = result
+    _spreads_by_id = {s.id: s for s in result}
     return _spreads_cache
 
 
+# Load the spreads now so get_spread is a bare dict lookup
+_load_spreads()
+
+
 # ---------------------------------------------------------------------------
 # Deck operations
 # ---------------------------------------------------------------------------
 
 
+_WORD64 = 1 << 64
+
+
+def _random_words(
+    count: int, fmt: str = "I", rng: Optional[random.Random] = None
+) -> tuple[int, ...]:
+    """*count* uniformly random integers from one ``secrets`` (or *rng*) call.
+
+    ``fmt`` is the ``struct`` code of the word size: ``"I"`` for 32-bit
+    words, ``"Q"`` for 64-bit words.
+    """
+    nbytes = struct.calcsize(fmt) * count
+    data = secrets.token_bytes(nbytes) if rng is None else rng.randbytes(nbytes)
+    return struct.unpack(f"<{count}{fmt}", data)
+
+
+def _random_bits(count: int, rng: Optional[random.Random] = None) -> int:
+    return secrets.randbits(count) if rng is None else rng.getrandbits(count)
+
+
+@lru_cache(maxsize=None)
+def _swap_batches(n: int) -> tuple[tuple[range, int, int], ...]:
+    """Group the Fisher-Yates steps of an *n*-card shuffle into shared draws.
+
+    Each entry ``(steps, bound, limit)`` covers the descending indices in
+    ``steps``. ``bound`` is the product of their ranges ``i + 1`` (at most
+    2**32) and ``limit`` the largest multiple of ``bound`` not above 2**64.
+    A 64-bit word below ``limit`` is reduced modulo ``bound`` and then split
+    into one uniform index per step by successive division.
+    """
+    batches = []
+    top = n - 1
+    while top > 0:
+        stop, bound = top, 1
+        while stop > 0 and bound * (stop + 1) <= 0x100000000:
+            bound *= stop + 1
+            stop -= 1
+        batches.append((range(top, stop, -1), bound, _WORD64 - _WORD64 % bound))
+        top = stop
+    return tuple(batches)
+
+
 def create_deck() -> list[TarotCard]:
     """Return a fresh copy of the 78-card deck."""
     return list(_load_cards())
 
 
-def shuffle_deck(cards: list[TarotCard]) -> list[TarotCard]:
-    """Fisher-Yates shuffle using cryptographic randomness."""
+def shuffle_deck(
+    cards: list[TarotCard], rng: Optional[random.Random] = None
+) -> list[TarotCard]:
+    """Fisher-Yates shuffle using cryptographic randomness (or *rng*)."""
     shuffled = list(cards)
-    for i in range(len(shuffled) - 1, 0, -1):
-        # Generate a random float in [0, 1) using 4 bytes of entropy
-        rand_float = int.from_bytes(secrets.token_bytes(4), "big") / 0x100000000
-        j = int(rand_float * (i + 1))
-        shuffled[i], shuffled[j] = shuffled[j], shuffled[i]
+    shuffle_deck_inplace(shuffled, rng)
     return shuffled
 
 
+def shuffle_deck_inplace(
+    deck: list[TarotCard], rng: Optional[random.Random] = None
+) -> None:
+    """Fisher-Yates shuffle of *deck* in place, without copying it."""
+    # Several swaps share one 64-bit word; all words are pulled up front
+    batches = _swap_batches(len(deck))
+    words = _random_words(len(batches), "Q", rng)
+    for (steps, bound, limit), word in zip(batches, words):
+        r = _batch_value(word, bound, limit, rng)
+        for i in steps:
+            r, j = divmod(r, i + 1)
+            deck[i], deck[j] = deck[j], deck[i]
+
+
+def _batch_value(
+    word: int, bound: int, limit: int, rng: Optional[random.Random] = None
+) -> int:
+    """Uniform integer in ``[0, bound)`` from a 64-bit word of a swap batch."""
+    # Reject the biased tail (probability < 2**-32) so indices are uniform
+    while word >= limit:
+        word = _random_words(1, "Q", rng)[0]
+    return word % bound
+
+
+def _check_draw_count(count: int, deck_size: int) -> None:
+    if count > deck_size:
+        raise ValueError(
+            f"Cannot draw {count} cards from a deck of {deck_size}"
+        )
+    if count < 0:
+        raise ValueError("Card count must be non-negative")
+
+
+def shuffle_and_draw(
+    cards: list[TarotCard],
+    count: int,
+    allow_reversals: bool = True,
+    rng: Optional[random.Random] = None,
+) -> list[DrawnCard]:
+    """Draw *count* cards from a freshly shuffled copy of *cards*.
+
+    Equivalent to
+    ``draw_cards(shuffle_deck(cards, rng), count, allow_reversals, rng)``,
+    but only the first *count* steps of the Fisher-Yates shuffle are run.
+    """
+    _check_draw_count(count, len(cards))
+    deck = list(cards)
+
+    # Step k swaps position k with a uniform pick from [k, n). Those ranges
+    # (n, n-1, ...) are the ones _swap_batches groups for the full shuffle.
+    batches = []
+    steps_left = count
+    for batch in _swap_batches(len(deck)):
+        if steps_left <= 0:
+            break
+        batches.append(batch)
+        steps_left -= len(batch[0])
+
+    k = 0
+    words = _random_words(len(batches), "Q", rng)
+    for (steps, bound, limit), word in zip(batches, words):
+        r = _batch_value(word, bound, limit, rng)
+        for i in steps:
+            if k == count:
+                break
+            r, j = divmod(r, i + 1)
+            j += k
+            deck[k], deck[j] = deck[j], deck[k]
+            k += 1
+
+    flips = _random_bits(count, rng) if allow_reversals else 0
+    return [
+        DrawnCard(card=deck[i], reversed=(flips >> i) & 1 == 1, positionIndex=i)
+        for i in range(count)
+    ]
+
+
 def draw_cards(
     deck: list[TarotCard],
     count: int,
     allow_reversals: bool = True,
+    rng: Optional[random.Random] = None,
 ) -> list[DrawnCard]:
     """Draw *count* cards from the top of the (pre-shuffled) deck."""
-    if count > len(deck):
-        raise ValueError(
-            f"Cannot draw {count} cards from a deck of {len(deck)}"
-        )
-    if count < 0:
-        raise ValueError("Card count must be non-negative")
+    _check_draw_count(count, len(deck))
 
-    drawn: list[DrawnCard] = []
-    for i in range(count):
-        rand_float = int.from_bytes(secrets.token_bytes(4), "big") / 0x100000000
-        reversed_ = allow_reversals and rand_float < 0.5
-        drawn.append(DrawnCard(card=deck[i], reversed=reversed_, positionIndex=i))
-    return drawn
+    if not allow_reversals:
+        return [
+            DrawnCard(card=card, reversed=False, positionIndex=i)
+            for i, card in enumerate(deck[:count])
+        ]
+    # Top bit of each word: a fair coin
+    words = _random_words(count, rng=rng)
+    return [
+        DrawnCard(card=card, reversed=word >> 31 == 1, positionIndex=i)
+        for i, (card, word) in enumerate(zip(deck, words))
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -114,10 +249,7 @@ def draw_cards(
 
 def get_spread(spread_id: str) -> Optional[SpreadDefinition]:
     """Look up a spread by id."""
-    for s in _load_spreads():
-        if s.id == spread_id:
-            return s
-    return None
+    return _spreads_by_id.get(spread_id)
 
 
 def get_all_spreads() -> list[SpreadDefinition]:
@@ -131,13 +263,21 @@ def get_all_spreads() -> list[SpreadDefinition]:
 
 
 class TarotEngine:
-    """Stateless tarot engine — all reading state lives in TarotReadingState."""
+    """Stateless tarot engine — all reading state lives in TarotReadingState.
+
+    ``rng`` is used for every reading that does not pass its own; by default
+    readings use ``secrets``.
+    """
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng = rng
 
     def start_reading(
         self,
         spread_id: str,
         question: str,
         allow_reversals: bool = True,
+        rng: Optional[random.Random] = None,
     ) -> TarotReadingState:
         spread = get_spread(spread_id)
         if spread is None:
@@ -146,15 +286,19 @@ class TarotEngine:
                 f'Unknown spread "{spread_id}". Available spreads: {available}'
             )
 
-        deck = shuffle_deck(create_deck())
-        drawn = draw_cards(deck, spread.cardCount, allow_reversals)
+        drawn = shuffle_and_draw(
+            _load_cards(),
+            spread.cardCount,
+            allow_reversals,
+            rng if rng is not None else self._rng,
+        )
 
         return TarotReadingState(
             spread=spread,
             question=question,
             drawnCards=drawn,
             revealedIndex=0,
-            userFeedback=[],
+            userFeedback=(),
         )
 
     def get_next_reveal(
@@ -183,7 +327,7 @@ class TarotEngine:
             question=state.question,
             drawnCards=state.drawnCards,
             revealedIndex=state.revealedIndex + 1,
-            userFeedback=[*state.userFeedback, feedback],
+            userFeedback=state.userFeedback + (feedback,),
         )
 
     def get_synthesis(self, state: TarotReadingState) -> dict:
@@ -10,7 +10,7 @@ from typing import Literal, Optional
 # Shared
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedbackEntry:
     element: str
     userText: str
@@ -25,7 +25,7 @@ ReadingSystem = Literal["tarot", "iching", "astrology"]
 # Tarot
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TarotCard:
     id: str
     name: str
@@ -43,21 +43,21 @@ class TarotCard:
     numerology: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DrawnCard:
     card: TarotCard
     reversed: bool
     positionIndex: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpreadPosition:
     index: int
     name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SpreadDefinition:
     id: str
     name: str
@@ -66,20 +66,20 @@ class SpreadDefinition:
     cardCount: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TarotReadingState:
     spread: SpreadDefinition
     drawnCards: list[DrawnCard]
     revealedIndex: int
     question: str
-    userFeedback: list[FeedbackEntry] = field(default_factory=list)
+    userFeedback: tuple[FeedbackEntry, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # I Ching
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trigram:
     number: int
     name: str
@@ -95,14 +95,14 @@ class Trigram:
     bodyPart: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HexagramLine:
     position: int
     text: str
     meaning: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Hexagram:
     number: int
     name: str
@@ -116,33 +116,38 @@ class Hexagram:
     lines: list[HexagramLine]
     keywords: list[str]
     description: str
+    # ``binary`` as a 6-bit int (bottom line = most significant bit)
+    binaryInt: int = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "binaryInt", int(self.binary, 2))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CastResult:
-    lines: list[int]
-    changingLines: list[int]
+    lines: tuple[int, ...]
+    changingLines: tuple[int, ...]
     hexagramNumber: int
     transformedHexagramNumber: Optional[int]
     binary: str
     transformedBinary: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IChingReadingState:
     question: str
     castResult: CastResult
     hexagram: Hexagram
     transformedHexagram: Optional[Hexagram]
     revealedLines: int
-    userFeedback: list[FeedbackEntry] = field(default_factory=list)
+    userFeedback: tuple[FeedbackEntry, ...] = ()
 
 
 # ---------------------------------------------------------------------------
 # Astrology
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BirthData:
     year: int
     month: int
@@ -154,7 +159,7 @@ class BirthData:
     timezone: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanetPosition:
     planet: str
     sign: str
@@ -164,14 +169,14 @@ class PlanetPosition:
     retrograde: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignPosition:
     sign: str
     degrees: float
     totalDegrees: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChartAspect:
     planet1: str
     planet2: str
@@ -183,7 +188,7 @@ class ChartAspect:
     nature: Literal["harmonious", "challenging", "neutral"]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NatalChart:
     sun: PlanetPosition
     moon: PlanetPosition
@@ -197,14 +202,28 @@ class NatalChart:
     pluto: PlanetPosition
     ascendant: SignPosition
     midheaven: SignPosition
-    aspects: list[ChartAspect]
-    houseCusps: list[float]
-
-
-@dataclass
+    aspects: tuple[ChartAspect, ...]
+    houseCusps: tuple[float, ...]
+    # The ten planet positions (sun to pluto) and their longitudes and houses
+    # as parallel tuples, so callers can scan them without per-name lookups
+    planets: tuple[PlanetPosition, ...] = field(init=False, repr=False, compare=False)
+    longitudes: tuple[float, ...] = field(init=False, repr=False, compare=False)
+    houses: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        planets = (
+            self.sun, self.moon, self.mercury, self.venus, self.mars,
+            self.jupiter, self.saturn, self.uranus, self.neptune, self.pluto,
+        )
+        object.__setattr__(self, "planets", planets)
+        object.__setattr__(self, "longitudes", tuple(p.totalDegrees for p in planets))
+        object.__setattr__(self, "houses", tuple(p.house for p in planets))
+
+
+@dataclass(slots=True, frozen=True)
 class AstrologyReadingState:
     birthData: BirthData
     chart: NatalChart
-    revealedPlanets: list[str] = field(default_factory=list)
-    revealedHouses: list[str] = field(default_factory=list)
-    userFeedback: list[FeedbackEntry] = field(default_factory=list)
+    revealedPlanets: tuple[str, ...] = ()
+    revealedHouses: tuple[str, ...] = ()
+    userFeedback: tuple[FeedbackEntry, ...] = ()
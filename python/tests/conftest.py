@@ -0,0 +1,59 @@
+"""Shared fixtures for the engine tests."""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from elizaos_plugin_mysticism.engines.astrology import (
+    AstrologyEngine,
+    calculate_natal_chart,
+)
+from elizaos_plugin_mysticism.engines.iching import IChingEngine
+from elizaos_plugin_mysticism.engines.tarot import TarotEngine, create_deck
+from elizaos_plugin_mysticism.types import BirthData, NatalChart, TarotCard
+
+
+@pytest.fixture(scope="session")
+def birth_1990_nyc() -> BirthData:
+    """March 25, 1990, noon in New York."""
+    return BirthData(year=1990, month=3, day=25, hour=12, minute=0,
+                     latitude=40.7128, longitude=-74.0060, timezone=-5)
+
+
+@pytest.fixture(scope="session")
+def chart_1990_nyc(birth_1990_nyc: BirthData) -> NatalChart:
+    return calculate_natal_chart(birth_1990_nyc)
+
+
+@pytest.fixture(scope="session")
+def pristine_deck() -> tuple[TarotCard, ...]:
+    """The unshuffled 78-card deck; copy it with ``list()`` before mutating."""
+    return tuple(create_deck())
+
+
+@pytest.fixture(scope="session")
+def rng() -> random.Random:
+    """One seeded generator shared by the randomised engine tests."""
+    return random.Random(0x5EED)
+
+
+# The engines keep no per-reading state, so one instance serves every test.
+
+
+@pytest.fixture(scope="session")
+def astrology_engine() -> AstrologyEngine:
+    return AstrologyEngine()
+
+
+@pytest.fixture(scope="session")
+def tarot_engine() -> TarotEngine:
+    return TarotEngine()
+
+
+@pytest.fixture(scope="session")
+def iching_engine() -> IChingEngine:
+    return IChingEngine()
@@ -1,14 +1,21 @@
 """Smoke tests for the I Ching engine."""
 
+import os
+import random
+import signal
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from elizaos_plugin_mysticism.engines import iching
 from elizaos_plugin_mysticism.engines.iching import (
     IChingEngine,
     binary_to_hexagram_number,
     cast_hexagram,
+    cast_hexagram_batch,
     get_hexagram,
     get_lower_trigram,
     get_trigram,
@@ -43,8 +50,7 @@ def test_cast_hexagram_number_range():
 
 def test_transformed_hexagram_only_with_changing_lines():
     # Run several casts; when there are no changing lines, transformed should be None
-    for _ in range(100):
-        result = cast_hexagram()
+    for result in cast_hexagram_batch(100):
         if not result.changingLines:
             assert result.transformedHexagramNumber is None
             assert result.transformedBinary is None
@@ -53,6 +59,38 @@ def test_transformed_hexagram_only_with_changing_lines():
             assert result.transformedBinary is not None
 
 
+def test_cast_hexagram_batch():
+    results = cast_hexagram_batch(50)
+    assert len(results) == 50
+    for result in results:
+        assert len(result.lines) == 6
+        assert binary_to_hexagram_number(result.binary) == result.hexagramNumber
+    assert cast_hexagram_batch(0) == []
+
+
+def test_cast_with_seeded_rng_is_reproducible():
+    assert cast_hexagram(random.Random(7)) == cast_hexagram(random.Random(7))
+    assert cast_hexagram_batch(5, random.Random(7)) == cast_hexagram_batch(
+        5, random.Random(7)
+    )
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_cast_after_fork_with_pool_lock_held():
+    # A child forked while the pool lock is held must still be able to cast
+    with iching._pool_lock:
+        pid = os.fork()
+        if pid == 0:
+            signal.alarm(5)  # a deadlocked child dies by SIGALRM
+            try:
+                cast_hexagram()
+            except BaseException:
+                os._exit(1)
+            os._exit(0)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+
+
 # ------------------------------------------------------------------
 # Hexagram / trigram lookups
 # ------------------------------------------------------------------
@@ -63,6 +101,8 @@ def test_all_64_hexagrams_accessible():
         h = get_hexagram(n)
         assert h.number == n
         assert len(h.binary) == 6
+        assert h.binaryInt == int(h.binary, 2)
+        assert binary_to_hexagram_number(h.binary) == n
 
 
 def test_all_8_trigrams_accessible():
@@ -84,6 +124,15 @@ def test_binary_to_hexagram_receptive():
     assert num == 2
 
 
+def test_binary_to_hexagram_invalid_raises():
+    for binary in ("11111", "1111111", "11112x"):
+        try:
+            binary_to_hexagram_number(binary)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+
+
 def test_trigram_from_hexagram():
     h = get_hexagram(1)  # The Creative: both trigrams are Qian (1)
     upper = get_upper_trigram(h)
@@ -111,22 +160,20 @@ def test_invalid_hexagram_raises():
 # ------------------------------------------------------------------
 
 
-def test_engine_start_reading():
-    engine = IChingEngine()
-    state = engine.start_reading("What is the way forward?")
+def test_engine_start_reading(iching_engine):
+    state = iching_engine.start_reading("What is the way forward?")
     assert state.question == "What is the way forward?"
     assert 1 <= state.hexagram.number <= 64
     assert state.revealedLines == 0
 
 
-def test_engine_reveal_cycle():
-    engine = IChingEngine()
-    state = engine.start_reading("Test question")
+def test_engine_reveal_cycle(rng, iching_engine):
+    state = iching_engine.start_reading("Test question", rng=rng)
 
     # Reveal all changing lines
     count = 0
     while True:
-        reveal = engine.get_next_reveal(state)
+        reveal = iching_engine.get_next_reveal(state)
         if reveal is None:
             break
         feedback = FeedbackEntry(
@@ -134,32 +181,36 @@ def test_engine_reveal_cycle():
             userText="Noted",
             timestamp=0,
         )
-        state = engine.record_feedback(state, feedback)
+        state = iching_engine.record_feedback(state, feedback)
         count += 1
 
-    assert engine.is_complete(state)
+    assert iching_engine.is_complete(state)
     assert count == len(state.castResult.changingLines)
 
 
-def test_engine_synthesis():
-    engine = IChingEngine()
-    state = engine.start_reading("Seeking clarity")
+def test_engine_rng_reproducible():
+    first = IChingEngine(random.Random(3)).start_reading("Q")
+    second = IChingEngine(random.Random(3)).start_reading("Q")
+    assert first.castResult == second.castResult
+
+
+def test_engine_synthesis(iching_engine):
+    state = iching_engine.start_reading("Seeking clarity")
 
     # Complete all reveals
-    while engine.get_next_reveal(state) is not None:
-        reveal = engine.get_next_reveal(state)
+    while iching_engine.get_next_reveal(state) is not None:
+        reveal = iching_engine.get_next_reveal(state)
         feedback = FeedbackEntry(element="line", userText="Ok", timestamp=0)
-        state = engine.record_feedback(state, feedback)
+        state = iching_engine.record_feedback(state, feedback)
 
-    synthesis = engine.get_synthesis(state)
+    synthesis = iching_engine.get_synthesis(state)
     assert "hexagram" in synthesis
     assert "question" in synthesis
 
 
-def test_engine_casting_summary():
-    engine = IChingEngine()
-    state = engine.start_reading("General inquiry")
-    summary = engine.get_casting_summary(state)
+def test_engine_casting_summary(iching_engine):
+    state = iching_engine.start_reading("General inquiry")
+    summary = iching_engine.get_casting_summary(state)
     assert "Hexagram" in summary
     assert "Upper:" in summary
     assert "Lower:" in summary
@@ -1,5 +1,6 @@
 """Smoke tests for the Tarot engine."""
 
+import random
 import sys
 from pathlib import Path
 
@@ -12,7 +13,9 @@ from elizaos_plugin_mysticism.engines.tarot import (
     draw_cards,
     get_all_spreads,
     get_spread,
+    shuffle_and_draw,
     shuffle_deck,
+    shuffle_deck_inplace,
 )
 from elizaos_plugin_mysticism.types import FeedbackEntry
 
@@ -27,15 +30,13 @@ def test_deck_has_78_cards():
     assert len(deck) == 78
 
 
-def test_major_arcana_count():
-    deck = create_deck()
-    majors = [c for c in deck if c.arcana == "major"]
+def test_major_arcana_count(pristine_deck):
+    majors = [c for c in pristine_deck if c.arcana == "major"]
     assert len(majors) == 22
 
 
-def test_minor_arcana_count():
-    deck = create_deck()
-    minors = [c for c in deck if c.arcana == "minor"]
+def test_minor_arcana_count(pristine_deck):
+    minors = [c for c in pristine_deck if c.arcana == "minor"]
     assert len(minors) == 56
 
 
@@ -44,14 +45,14 @@ def test_minor_arcana_count():
 # ------------------------------------------------------------------
 
 
-def test_shuffle_preserves_length():
-    deck = create_deck()
+def test_shuffle_preserves_length(pristine_deck):
+    deck = list(pristine_deck)
     shuffled = shuffle_deck(deck)
     assert len(shuffled) == 78
 
 
-def test_shuffle_changes_order():
-    deck = create_deck()
+def test_shuffle_changes_order(pristine_deck):
+    deck = list(pristine_deck)
     shuffled = shuffle_deck(deck)
     # Extremely unlikely all 78 cards stay in the same position
     ids_before = [c.id for c in deck]
@@ -59,22 +60,28 @@ def test_shuffle_changes_order():
     assert ids_before != ids_after
 
 
-def test_draw_returns_correct_count():
-    deck = shuffle_deck(create_deck())
+def test_shuffle_inplace_keeps_cards(pristine_deck):
+    deck = list(pristine_deck)
+    assert shuffle_deck_inplace(deck) is None
+    assert sorted(c.id for c in deck) == sorted(c.id for c in pristine_deck)
+
+
+def test_draw_returns_correct_count(pristine_deck):
+    deck = shuffle_deck(list(pristine_deck))
     drawn = draw_cards(deck, 3)
     assert len(drawn) == 3
     for i, dc in enumerate(drawn):
         assert dc.positionIndex == i
 
 
-def test_draw_zero():
-    deck = shuffle_deck(create_deck())
+def test_draw_zero(pristine_deck):
+    deck = shuffle_deck(list(pristine_deck))
     drawn = draw_cards(deck, 0)
     assert len(drawn) == 0
 
 
-def test_draw_too_many_raises():
-    deck = shuffle_deck(create_deck())
+def test_draw_too_many_raises(pristine_deck):
+    deck = shuffle_deck(list(pristine_deck))
     try:
         draw_cards(deck, 100)
         assert False, "Expected ValueError"
@@ -82,6 +89,21 @@ def test_draw_too_many_raises():
         pass
 
 
+def test_shuffle_and_draw_distinct_cards(pristine_deck):
+    deck = list(pristine_deck)
+    drawn = shuffle_and_draw(deck, 10)
+    assert [dc.positionIndex for dc in drawn] == list(range(10))
+    assert len({dc.card.id for dc in drawn}) == 10
+    assert [c.id for c in deck] == [c.id for c in pristine_deck]
+
+
+def test_shuffle_with_seeded_rng_is_reproducible(pristine_deck):
+    deck = list(pristine_deck)
+    assert shuffle_deck(deck, random.Random(7)) == shuffle_deck(deck, random.Random(7))
+    first = shuffle_and_draw(deck, 5, rng=random.Random(7))
+    assert first == shuffle_and_draw(deck, 5, rng=random.Random(7))
+
+
 # ------------------------------------------------------------------
 # Spreads
 # ------------------------------------------------------------------
@@ -109,47 +131,49 @@ def test_three_card_spread():
 # ------------------------------------------------------------------
 
 
-def test_engine_start_reading():
-    engine = TarotEngine()
-    state = engine.start_reading("three_card", "What should I focus on?")
+def test_engine_start_reading(tarot_engine):
+    state = tarot_engine.start_reading("three_card", "What should I focus on?")
     assert len(state.drawnCards) == 3
     assert state.revealedIndex == 0
     assert state.question == "What should I focus on?"
 
 
-def test_engine_reveal_cycle():
-    engine = TarotEngine()
-    state = engine.start_reading("single", "Quick guidance")
+def test_engine_reveal_cycle(rng, tarot_engine):
+    state = tarot_engine.start_reading("single", "Quick guidance", rng=rng)
 
-    assert not engine.is_complete(state)
+    assert not tarot_engine.is_complete(state)
 
-    reveal = engine.get_next_reveal(state)
+    reveal = tarot_engine.get_next_reveal(state)
     assert reveal is not None
     assert "card" in reveal
 
     feedback = FeedbackEntry(element="card_0", userText="Interesting", timestamp=0)
-    state = engine.record_feedback(state, feedback)
+    state = tarot_engine.record_feedback(state, feedback)
+
+    assert tarot_engine.is_complete(state)
+    assert tarot_engine.get_next_reveal(state) is None
+
 
-    assert engine.is_complete(state)
-    assert engine.get_next_reveal(state) is None
+def test_engine_rng_reproducible():
+    first = TarotEngine(random.Random(3)).start_reading("three_card", "Q")
+    second = TarotEngine(random.Random(3)).start_reading("three_card", "Q")
+    assert first.drawnCards == second.drawnCards
 
 
-def test_engine_synthesis():
-    engine = TarotEngine()
-    state = engine.start_reading("single", "Daily guidance")
+def test_engine_synthesis(tarot_engine):
+    state = tarot_engine.start_reading("single", "Daily guidance")
 
     feedback = FeedbackEntry(element="card_0", userText="I see", timestamp=0)
-    state = engine.record_feedback(state, feedback)
+    state = tarot_engine.record_feedback(state, feedback)
 
-    synthesis = engine.get_synthesis(state)
+    synthesis = tarot_engine.get_synthesis(state)
     assert "spread" in synthesis
     assert "cards" in synthesis
 
 
-def test_engine_unknown_spread_raises():
-    engine = TarotEngine()
+def test_engine_unknown_spread_raises(tarot_engine):
     try:
-        engine.start_reading("nonexistent_spread", "Test")
+        tarot_engine.start_reading("nonexistent_spread", "Test")
         assert False, "Expected ValueError"
     except ValueError as e:
         assert "nonexistent_spread" in str(e)